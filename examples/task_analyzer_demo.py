@@ -37,9 +37,15 @@ from src.exceptions import (
     ValidationError,
 )
 from src.llm_client import LangChainLLMClient
-from src.models.task import (
-    Task,  # noqa: TC001 - E402: Import after sys.path; TC001: Need at runtime for method calls
-)
+from src.models.task import Task
+
+try:
+    import uvloop  # pyright: ignore[reportMissingImports]
+except ImportError:  # Optional: pip install -e ".[speedups]"
+    uvloop = None
+
+# Maximum number of error scenarios analyzed concurrently
+ERROR_SCENARIO_CONCURRENCY = 4
 
 # Example task descriptions for different scenarios
 EXAMPLE_TASKS = {
@@ -105,9 +111,9 @@ def print_task_info(task_info: dict[str, str]) -> None:
     print_separator()
 
 
-def print_task_result(task: Task, elapsed_time: float) -> None:
+def print_task_result(task: Task) -> None:
     """Pretty print the task analysis result."""
-    print(f"\n✅ Analysis completed in {elapsed_time:.2f} seconds")
+    print("\n✅ Analysis completed")
     print("\n📊 Task Analysis Result:")
     print_separator()
 
@@ -168,70 +174,82 @@ def print_error(error: Exception) -> None:
             print(f"   Retry Count: {error.retry_count}")
 
 
-async def analyze_single_task(
-    analyzer: WebTaskAnalyzer,
-    task_name: str,  # noqa: ARG001 - Unused but kept for consistent function signature
+def print_analysis_outcome(
     task_info: dict[str, str],
+    result: Task | BaseException,
 ) -> None:
-    """Analyze a single task and print results."""
+    """Print the outcome of one task analysis from a batch."""
     print_task_info(task_info)
 
-    try:
-        # Measure execution time
-        start_time = time.time()
+    if isinstance(result, Task):
+        print_task_result(result)
+    elif isinstance(
+        result,
+        InvalidResponseFormatError
+        | ValidationError
+        | LLMCommunicationError
+        | RateLimitError
+        | ContextLengthExceededError,
+    ):
+        print_error(result)
+    else:
+        print(f"\n❌ Unexpected error: {type(result).__name__}: {result!s}")
+
+
+async def analyze_example_tasks(
+    analyzer: WebTaskAnalyzer,
+    task_names: list[str],
+    max_concurrency: int,
+) -> None:
+    """Analyze the selected example tasks concurrently and print their results."""
+    tasks_info = [EXAMPLE_TASKS[task_name] for task_name in task_names]
 
-        # Analyze the task
-        task = await analyzer.analyze_task(
-            task_description=task_info["description"],
-            url=task_info["url"],
-        )
+    # Measure execution time of the whole batch
+    start_time = time.perf_counter()
+
+    results = await analyzer.analyze_tasks(
+        [(task_info["description"], task_info["url"]) for task_info in tasks_info],
+        max_concurrency=max_concurrency,
+    )
 
-        elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
 
-        # Print results
-        print_task_result(task, elapsed_time)
+    for task_info, result in zip(tasks_info, results, strict=True):
+        print_analysis_outcome(task_info, result)
+        print("\n" + "=" * 80 + "\n")
 
-    except (
-        InvalidResponseFormatError,
-        ValidationError,
-        LLMCommunicationError,
-        RateLimitError,
-        ContextLengthExceededError,
-    ) as e:
-        print_error(e)
-    except Exception as e:  # noqa: BLE001 - Catch all errors to show unexpected error handling in demo
-        print(f"\n❌ Unexpected error: {type(e).__name__}: {e!s}")
+    # The analyses ran concurrently, so only the batch as a whole is timed
+    print(f"⏱️  Analyzed {len(tasks_info)} task(s) in {elapsed_time:.2f} seconds")
 
 
 async def demonstrate_error_handling(analyzer: WebTaskAnalyzer) -> None:
     """Demonstrate error handling scenarios."""
     print_header("Error Handling Demonstration")
 
-    # Test 1: Invalid task description (should trigger validation error)
-    print("\n🧪 Test 1: Empty task description")
-    print_separator()
-    try:
-        await analyzer.analyze_task(
-            task_description="",  # Empty description should fail
-            url="https://example.com",
-        )
-    except Exception as e:  # noqa: BLE001 - Intentionally broad to demonstrate error handling for any exception
-        print_error(e)
+    # Each scenario is an independent LLM round-trip, so run them concurrently
+    # and print the outcomes in order once they have all settled.
+    scenarios = [
+        (
+            "Test 1: Empty task description",
+            "",  # Empty description should fail
+        ),
+        (
+            "Test 2: Extremely long task description",
+            # A very long task description (might trigger context length error)
+            "Extract all product information including " + "very detailed specifications, " * 500,
+        ),
+    ]
+    results = await analyzer.analyze_tasks(
+        [(description, "https://example.com") for _, description in scenarios],
+        max_concurrency=ERROR_SCENARIO_CONCURRENCY,
+    )
 
-    # Test 2: Very long task description (might trigger context length error)
-    print("\n\n🧪 Test 2: Extremely long task description")
-    print_separator()
-    try:
-        # Create a very long task description
-        long_description = (
-            "Extract all product information including " + "very detailed specifications, " * 500
-        )
-        await analyzer.analyze_task(
-            task_description=long_description,
-            url="https://example.com",
-        )
-    except Exception as e:  # noqa: BLE001 - Intentionally broad to demonstrate error handling for any exception
-        print_error(e)
+    for i, ((title, _), result) in enumerate(zip(scenarios, results, strict=True)):
+        prefix = "\n\n" if i else "\n"
+        print(f"{prefix}🧪 {title}")
+        print_separator()
+        if isinstance(result, Exception):
+            print_error(result)
 
 
 async def main() -> None:
@@ -261,12 +279,18 @@ async def main() -> None:
         action="store_true",
         help="Skip error handling demonstration",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of tasks analyzed concurrently (default: 4)",
+    )
 
     args = parser.parse_args()
 
     # Print header
     print_header("WebTaskAnalyzer Integration Example")
-    print(f"\n📅 Date: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    print(f"\n📅 Date: {datetime.now(UTC).isoformat(timespec='seconds')}")
     print(f"🤖 Provider: {args.provider}")
     print(f"🧠 Model: {args.model or 'Default for provider'}")
 
@@ -299,6 +323,9 @@ async def main() -> None:
             retry_delay=1.0,
         )
 
+        # Open provider connections up front so the first analyses skip the handshakes
+        await analyzer.warmup(connections=args.max_concurrency)
+
         print("✅ Initialization complete")
 
         # Determine which tasks to run
@@ -307,10 +334,11 @@ async def main() -> None:
         # Run example tasks
         print_header("Task Analysis Examples")
 
-        for task_name in tasks_to_run:
-            if task_name in EXAMPLE_TASKS:
-                await analyze_single_task(analyzer, task_name, EXAMPLE_TASKS[task_name])
-                print("\n" + "=" * 80 + "\n")
+        await analyze_example_tasks(
+            analyzer,
+            [task_name for task_name in tasks_to_run if task_name in EXAMPLE_TASKS],
+            max_concurrency=args.max_concurrency,
+        )
 
         # Demonstrate error handling
         if not args.skip_errors:
@@ -327,5 +355,8 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    # Run the async main function
-    asyncio.run(main())
+    # Run the async main function, on uvloop's libuv-based event loop when installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
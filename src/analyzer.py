@@ -1,10 +1,16 @@
 """Web Task Analyzer module for understanding natural language task descriptions."""
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import random
+import re
+import string
 import time
-from typing import Any, Protocol
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import tenacity
 from tenacity import (
@@ -21,9 +27,20 @@ from src.exceptions import (
     ValidationError,
 )
 from src.llm_provider import LLMProvider
-from src.models.task import Task
+from src.models.task import Task, TaskData
 from src.prompts.task_analysis import get_prompt_config
-from src.utils.json_utils import extract_json_from_text, normalize_optional_fields
+from src.utils.cache import CacheBackend, LRUCache
+from src.utils.json_utils import (
+    decode_leading_json_object,
+    extract_json_from_text,
+    is_null_value,
+)
+from src.utils.rate_limiter import AsyncRateLimiter
+from src.utils.single_flight import SingleFlight
+from src.utils.template_cache import StructuralTemplateCache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +50,143 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # Base delay in seconds
 MAX_RETRY_DELAY = 60.0  # Maximum delay between retries
 RATE_LIMIT_RETRY_MULTIPLIER = 5.0  # Multiplier for rate limit delays
+HTTP_TOO_MANY_REQUESTS = 429
+CHARS_PER_TOKEN_ESTIMATE = 4  # Rough English average; errs towards underestimating tokens
+
+# Provider error messages that classify a ValueError (matched case-insensitively)
+_RATE_LIMIT_PATTERN = re.compile(r"rate limit|too many requests", re.IGNORECASE)
+_CONTEXT_LENGTH_PATTERN = re.compile(r"context length|token limit", re.IGNORECASE)
+
+# Errors raised by the analyzer itself, which are propagated unwrapped
+_ANALYSIS_ERRORS = (InvalidResponseFormatError, ValidationError, ContextLengthExceededError)
+# Errors that retrying the same request cannot fix
+_NON_RETRYABLE_ERRORS = (*_ANALYSIS_ERRORS, json.JSONDecodeError)
+DEFAULT_MAX_CONCURRENCY = 8  # Maximum concurrent analyses in analyze_tasks
+DEFAULT_MAX_IN_FLIGHT_REQUESTS = 32  # Maximum concurrent LLM requests per analyzer
+
+# Task fields checked while parsing LLM responses
+REQUIRED_FIELDS = ("description", "objectives", "success_criteria")
+NON_EMPTY_LIST_FIELDS = ("objectives", "success_criteria")
+LIST_FIELDS = ("objectives", "success_criteria", "constraints")
+OPTIONAL_LIST_FIELDS = ("data_to_extract", "actions_to_perform")
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+_TASK_FIELD_SET = frozenset(Task.model_fields)
+
+PROMPT_CACHE_SIZE = 512  # Formatted prompts kept for repeated (url, description) pairs
+_PROMPT_FIELDS = frozenset(("url", "task_description"))
+
+
+def _preview_response(response: str) -> str:
+    """Truncate a response for error messages and logs, marking the cut with '...'."""
+    if len(response) <= RESPONSE_PREVIEW_LENGTH:
+        return response
+    return f"{response[:RESPONSE_PREVIEW_LENGTH]}..."
+
+
+def _no_json_object_error(response: str) -> InvalidResponseFormatError:
+    """Build the error raised when a response contains no usable JSON object."""
+    error_msg = (
+        f"No valid JSON object found in LLM response. "
+        f"Expected a JSON object with task analysis, but received: "
+        f"{_preview_response(response)}"
+    )
+    return InvalidResponseFormatError(
+        error_msg,
+        response=response,
+        expected_format="JSON object with fields: description, objectives, success_criteria",
+    )
+
+
+def _is_rate_limit_error(error: BaseException | None) -> bool:
+    """Check whether an error reports that the provider's rate limit was hit."""
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, ValueError):
+        return _RATE_LIMIT_PATTERN.search(str(error)) is not None
+    return False
+
+
+def _validate_string_items(field: str, items: list[Any]) -> None:
+    """
+    Check that every item of a list field is a string.
+
+    The happy path is a single C-level pass; the offending item is only located
+    when that pass fails.
+
+    Raises:
+        ValidationError: Naming the first item that is not a string
+    """
+    if all(type(item) is str for item in items):
+        return
+    for i, item in enumerate(items):
+        if not isinstance(item, str):
+            msg = f"Item {i} in field '{field}' must be a string"
+            raise ValidationError(
+                msg,
+                field=f"{field}[{i}]",
+                value=item,
+                expected_type="string",
+            )
+
+
+def _retry_after_seconds(error: BaseException) -> float | None:
+    """
+    Read the Retry-After delay from the HTTP response attached to a provider SDK error.
+
+    Only the delay-seconds form is understood; HTTP-date values are ignored.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=len(LLMProvider))
+def _parse_prompt_template(prompt_template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """
+    Split a prompt template into (literal, field) segments, once per template.
+
+    Returns None when the template uses anything beyond plain {url} and
+    {task_description} fields (format specs, conversions, other names), in which
+    case it has to go through str.format.
+    """
+    segments = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(prompt_template):
+        if field is not None and (field not in _PROMPT_FIELDS or format_spec or conversion):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+@functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _format_prompt(prompt_template: str, url: str, task_description: str) -> str:
+    """Format a prompt template, memoizing the result for repeated inputs."""
+    segments = _parse_prompt_template(prompt_template)
+    if segments is None:
+        return prompt_template.format(url=url, task_description=task_description)
+
+    values = {"url": url, "task_description": task_description}
+    return "".join(literal + values[field] if field else literal for literal, field in segments)
+
+
+class _RequestLogger(logging.LoggerAdapter[logging.Logger]):
+    """
+    Logger adapter that binds per-request context to every record.
+
+    Unlike the base LoggerAdapter, extras passed to an individual call are merged
+    with the bound context instead of replacing it, so calls only pass the fields
+    specific to that record.
+    """
+
+    def process(self, msg: Any, kwargs: Any) -> tuple[Any, Any]:
+        """Merge the bound context into the record's extra fields."""
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**(self.extra or {}), **extra} if extra else self.extra
+        return msg, kwargs
 
 
 class LLMClient(Protocol):
@@ -43,6 +197,14 @@ class LLMClient(Protocol):
         ...
 
 
+class StreamingLLMClient(LLMClient, Protocol):
+    """Protocol for LLM clients that can also stream their response."""
+
+    def complete_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Complete a prompt and yield the response as text chunks."""
+        ...
+
+
 class WebTaskAnalyzer:
     """Analyzes natural language task descriptions and converts them to structured Task objects."""
 
@@ -53,6 +215,15 @@ class WebTaskAnalyzer:
         provider: str = LLMProvider.ANTHROPIC.value,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        *,
+        stream: bool = False,
+        rate_limit_per_minute: float | None = None,
+        response_cache_size: int = 0,
+        response_cache_ttl: float | None = None,
+        structural_cache_size: int = 0,
+        coalesce_requests: bool = False,
+        concurrency: asyncio.Semaphore | None = None,
+        response_store: CacheBackend | None = None,
     ) -> None:
         """
         Initialize the WebTaskAnalyzer with an LLM client.
@@ -65,6 +236,35 @@ class WebTaskAnalyzer:
                      Falls back to "anthropic" if invalid provider is specified
             max_retries: Maximum number of retry attempts for transient errors (default: 3)
             retry_delay: Base delay in seconds between retries (default: 1.0)
+            stream: Stream the LLM response and stop reading as soon as a complete
+                   JSON object has arrived (default: False). Requires a client that
+                   implements complete_stream; falls back to complete otherwise.
+            rate_limit_per_minute: Maximum LLM requests per minute, including retries
+                   (default: None, no limit). Requests beyond the limit wait for
+                   capacity instead of being sent and rejected by the provider.
+            response_cache_size: Number of analyzed tasks to keep, keyed by provider and
+                   prompt (default: 0, caching disabled). Repeated analyses of the same
+                   task and URL are then answered without calling the LLM.
+            response_cache_ttl: Seconds a cached analysis stays valid (default: None,
+                   entries only leave the cache when evicted)
+            structural_cache_size: Number of analyses to keep as templates for task
+                   descriptions that differ only in their URLs and numbers (default: 0,
+                   disabled). A template hit adapts the cached analysis to the new
+                   task textually instead of calling the LLM.
+            coalesce_requests: Let concurrent analyses of the same task and URL share a
+                   single LLM request instead of each sending their own (default:
+                   False). Coalesced callers each get their own copy of the Task, but
+                   a failure is raised to all of them as the same exception object.
+            concurrency: Semaphore capping the number of LLM requests in flight
+                   (default: None, a private limit of 32). Analyzers given the same
+                   semaphore share one budget, so several analyzers for one provider
+                   account can stay under its concurrency limit together. Requests
+                   waiting for a slot do not count against the timeout.
+            response_store: Backend storing raw LLM responses keyed by provider and
+                   prompt (default: None). Consulted after the in-process caches miss
+                   and before calling the LLM; only responses that parse and validate
+                   are stored. Use LRUMemoryCache, or an external store to share
+                   responses across processes and runs.
 
         Note:
             The prompt configuration includes recommended settings for temperature
@@ -76,6 +276,22 @@ class WebTaskAnalyzer:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
+        # Streaming needs a client that implements complete_stream
+        if stream and not callable(getattr(llm_client, "complete_stream", None)):
+            logger.warning(
+                "LLM client %s does not support streaming. Falling back to complete()",
+                type(llm_client).__name__,
+            )
+            stream = False
+        self.stream = stream
+
+        # Pace outgoing requests when a rate limit is configured
+        self.rate_limiter = (
+            AsyncRateLimiter(rate_limit_per_minute, time_period=60.0)
+            if rate_limit_per_minute
+            else None
+        )
+
         # Validate provider and fall back to default if invalid
         if not LLMProvider.is_valid(provider):
             logger.warning(
@@ -88,6 +304,29 @@ class WebTaskAnalyzer:
         self.provider = provider
         self.prompt_config = get_prompt_config(provider)
 
+        # Admission control for outgoing requests, possibly shared with other analyzers
+        self._concurrency = concurrency or asyncio.Semaphore(DEFAULT_MAX_IN_FLIGHT_REQUESTS)
+
+        # Optional store of raw responses, possibly outside this process
+        self._response_store = response_store
+
+        # Analyzed tasks keyed by provider and prompt, when enabled
+        self._response_cache = (
+            LRUCache(maxsize=response_cache_size, ttl=response_cache_ttl)
+            if response_cache_size
+            else None
+        )
+
+        # Analyses reused across structurally identical task descriptions, when enabled
+        self._structural_cache = (
+            StructuralTemplateCache(maxsize=structural_cache_size, namespace=provider)
+            if structural_cache_size
+            else None
+        )
+
+        # Analyses in flight keyed by provider and prompt, for request coalescing
+        self._single_flight = SingleFlight() if coalesce_requests else None
+
     def _is_retryable_error(self, exception: BaseException) -> bool:
         """Determine if an exception should trigger a retry.
 
@@ -98,27 +337,24 @@ class WebTaskAnalyzer:
             bool: True if the error is retryable, False otherwise
         """
         # Non-retryable errors
-        if isinstance(
-            exception,
-            InvalidResponseFormatError
-            | ValidationError
-            | ContextLengthExceededError
-            | json.JSONDecodeError,
-        ):
+        if isinstance(exception, _NON_RETRYABLE_ERRORS):
             return False
 
-        # Rate limit errors are retryable but handled specially
-        if isinstance(exception, ValueError):
-            error_msg = str(exception).lower()
-            if "context length" in error_msg or "token limit" in error_msg:
-                return False
+        # A provider asking for a longer wait than any retry delay is left to the caller
+        if isinstance(exception, RateLimitError) and (exception.retry_after or 0) > MAX_RETRY_DELAY:
+            return False
 
-        # All other errors are retryable
-        return True
+        # Context length errors are not retryable; rate limit and all other errors are
+        return not (
+            isinstance(exception, ValueError) and _CONTEXT_LENGTH_PATTERN.search(str(exception))
+        )
 
-    def _create_retry_decorator(self) -> Any:
+    def _create_retry_decorator(self, log: _RequestLogger) -> Any:
         """Create a tenacity retry decorator with custom configuration.
 
+        Args:
+            log: Logger for retry records, bound to the analysis' context
+
         Returns:
             retry: Configured retry decorator
         """
@@ -126,7 +362,7 @@ class WebTaskAnalyzer:
         def before_retry(retry_state: tenacity.RetryCallState) -> None:
             """Log retry attempts."""
             if retry_state.attempt_number > 1:
-                logger.info(
+                log.info(
                     "Retrying task analysis",
                     extra={
                         "attempt": retry_state.attempt_number,
@@ -143,31 +379,40 @@ class WebTaskAnalyzer:
                     exception.retry_count = retry_state.attempt_number
 
         def determine_wait(retry_state: tenacity.RetryCallState) -> float:
-            """Determine wait time based on error type."""
-            if retry_state.outcome and retry_state.outcome.failed:
-                exception = retry_state.outcome.exception()
-                if isinstance(exception, ValueError):
-                    error_msg = str(exception).lower()
-                    if "rate limit" in error_msg or "too many requests" in error_msg:
-                        # Use longer delay for rate limits
-                        wait_time = min(
-                            self.retry_delay
-                            * (2 ** (retry_state.attempt_number - 1))
-                            * RATE_LIMIT_RETRY_MULTIPLIER,
-                            MAX_RETRY_DELAY,
-                        )
-                        logger.warning(
-                            "Rate limit detected, using extended delay",
-                            extra={"wait_time": wait_time, "attempt": retry_state.attempt_number},
-                        )
-                        return wait_time
-
-            # Default exponential backoff
-            return min(
-                self.retry_delay * (2 ** (retry_state.attempt_number - 1)),
-                MAX_RETRY_DELAY,
+            """Determine wait time based on error type.
+
+            Uses exponential backoff with full jitter: the wait is drawn uniformly
+            between zero and the backoff ceiling, so concurrent analyses that failed
+            together do not all retry at the same moment. A Retry-After delay sent
+            by the provider is honored as a lower bound, up to MAX_RETRY_DELAY.
+            """
+            attempt = retry_state.attempt_number
+            exception = (
+                retry_state.outcome.exception()
+                if retry_state.outcome and retry_state.outcome.failed
+                else None
             )
 
+            rate_limited = _is_rate_limit_error(exception)
+            backoff = self.retry_delay * (2 ** (attempt - 1))
+            if rate_limited:
+                # Use longer delay for rate limits
+                backoff *= RATE_LIMIT_RETRY_MULTIPLIER
+
+            # Jitter is for spreading load, not security
+            wait_time = random.uniform(0, min(backoff, MAX_RETRY_DELAY))  # noqa: S311
+
+            if rate_limited:
+                retry_after = getattr(exception, "retry_after", None)
+                if retry_after is not None:
+                    wait_time = min(max(wait_time, retry_after), MAX_RETRY_DELAY)
+                log.warning(
+                    "Rate limit detected, using extended delay",
+                    extra={"wait_time": wait_time, "attempt": attempt},
+                )
+
+            return wait_time
+
         return retry(
             retry=retry_if_exception(self._is_retryable_error),
             stop=stop_after_attempt(self.max_retries),
@@ -177,6 +422,52 @@ class WebTaskAnalyzer:
             reraise=True,
         )
 
+    async def warmup(self, connections: int = 1) -> None:
+        """
+        Establish connections to the LLM provider before the first analysis.
+
+        Cold connection setup (DNS, TCP and TLS handshakes) otherwise lands on the
+        first analyze_task call. Warmup is best effort: clients without a warmup
+        method, or whose warmup returns False, are skipped, and failures are logged
+        rather than raised. Warmup requests wait for the same concurrency slots and
+        rate limit capacity as analyses, so they do not exceed the provider budget.
+
+        Args:
+            connections: Number of connections to open in parallel, e.g. the
+                        concurrency later passed to analyze_tasks (default: 1)
+        """
+        warmup = getattr(self.llm, "warmup", None)
+        if not callable(warmup):
+            logger.debug("LLM client %s does not support warmup", type(self.llm).__name__)
+            return
+        warmup = cast("Callable[[], Awaitable[object]]", warmup)
+
+        async def warm_connection() -> object:
+            async with self._concurrency:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
+                return await warmup()
+
+        start_time = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout or None):
+                results = await asyncio.gather(*(warm_connection() for _ in range(connections)))
+        except Exception as e:  # noqa: BLE001 - warmup must never break startup
+            logger.warning(
+                "LLM connection warmup failed",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
+            return
+
+        if all(result is False for result in results):
+            logger.debug("LLM client %s skipped warmup", type(self.llm).__name__)
+            return
+
+        logger.info(
+            "LLM connections warmed up",
+            extra={"connections": connections, "warmup_time": time.perf_counter() - start_time},
+        )
+
     async def _perform_llm_call(self, prompt: str) -> str:
         """Perform the LLM API call with timeout handling.
 
@@ -189,22 +480,77 @@ class WebTaskAnalyzer:
         Raises:
             TimeoutError: If the request times out
         """
-        start_time = time.time()
+        # Wait for a concurrency slot and rate limit capacity before starting the
+        # timeout clock, so queued requests do not time out before being sent
+        async with self._concurrency:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
 
-        if self.timeout:
-            response = await asyncio.wait_for(self.llm.complete(prompt), timeout=self.timeout)
-        else:
-            response = await self.llm.complete(prompt)
+            start_time = time.perf_counter()
 
-        elapsed_time = time.time() - start_time
+            # asyncio.timeout sets a deadline on the current task instead of wrapping the
+            # call in a new one; a None deadline (no timeout configured) never expires
+            async with asyncio.timeout(self.timeout or None):
+                if self.stream:
+                    response = await self._stream_llm_response(prompt)
+                else:
+                    response = await self.llm.complete(prompt)
 
-        logger.info(
-            "Received LLM response",
-            extra={
-                "response_length": len(response),
-                "elapsed_time": elapsed_time,
-            },
-        )
+        elapsed_time = time.perf_counter() - start_time
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Received LLM response",
+                extra={
+                    "response_length": len(response),
+                    "elapsed_time": elapsed_time,
+                },
+            )
+
+        return response
+
+    async def _stream_llm_response(self, prompt: str) -> str:
+        """Stream the LLM response, stopping once a complete JSON object has arrived.
+
+        The model usually keeps generating (or simply stays open) after the closing
+        brace of the JSON object, so reading stops at the first point where the text
+        from the first opening brace decodes to an object. If no such point is
+        reached, the whole stream is consumed.
+
+        Decoding is only attempted once the running brace count says the object may
+        be closed, so the buffer is re-parsed a handful of times rather than on
+        every chunk. Braces inside string values can skew the count; that only
+        delays the early stop, it never truncates the response.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Returns:
+            str: The response text received so far
+        """
+        stream = cast("StreamingLLMClient", self.llm).complete_stream(prompt)
+        response = ""
+        open_braces = 0
+        seen_open_brace = False
+        try:
+            async for chunk in stream:
+                response += chunk
+                opened = chunk.count("{")
+                closed = chunk.count("}")
+                open_braces += opened - closed
+                seen_open_brace = seen_open_brace or opened > 0
+                if not (closed and seen_open_brace and open_braces <= 0):
+                    continue
+                if decode_leading_json_object(response) is not None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Complete JSON object received, closing stream",
+                            extra={"response_length": len(response)},
+                        )
+                    break
+        finally:
+            if isinstance(stream, AsyncGenerator):
+                await stream.aclose()
 
         return response
 
@@ -225,14 +571,15 @@ class WebTaskAnalyzer:
             # Parse and validate the response
             task_data = self._parse_llm_response(response)
 
-            # Create and validate the Task object
-            task = Task(**task_data)
+            # The parsed data has already been validated field by field, so the Task
+            # is built without running the same checks again through pydantic
+            task = Task.model_construct(**task_data)
 
         except json.JSONDecodeError as e:
             # JSON decode errors are not retryable
             logger.exception(
                 "Failed to parse LLM response as JSON",
-                extra={"error": str(e), "response_preview": response[:200]},
+                extra={"error": str(e), "response_preview": _preview_response(response)},
             )
             msg = f"Could not parse LLM response as JSON: {e}"
             raise InvalidResponseFormatError(
@@ -243,14 +590,12 @@ class WebTaskAnalyzer:
 
         except ValueError as e:
             # Check if it's a specific error we should handle differently
-            error_msg = str(e).lower()
-
-            if "rate limit" in error_msg or "too many requests" in error_msg:
+            if _is_rate_limit_error(e):
                 logger.warning("Rate limit detected")
                 msg = "Rate limit exceeded for LLM API"
-                raise RateLimitError(msg) from e
+                raise RateLimitError(msg, retry_after=_retry_after_seconds(e)) from e
 
-            if "context length" in error_msg or "token limit" in error_msg:
+            if _CONTEXT_LENGTH_PATTERN.search(str(e)):
                 # Context length errors are not retryable
                 msg = "Prompt exceeds LLM context length limit"
                 raise ContextLengthExceededError(
@@ -287,57 +632,124 @@ class WebTaskAnalyzer:
             RateLimitError: If rate limit is exceeded
             ContextLengthExceededError: If prompt is too long
         """
-        # Build the analysis prompt
+        # Build the analysis prompt and reject it up front if it cannot fit
         prompt = self._build_analysis_prompt(task_description, url)
-        prompt_length = len(prompt)
+        self._check_prompt_size(prompt)
 
-        logger.info(
-            "Starting task analysis",
-            extra={
-                "url": url,
-                "task_description_length": len(task_description),
-                "prompt_length": prompt_length,
-                "provider": self.provider,
-            },
+        # Hashed once and shared by the response cache, the in-flight registry and
+        # the log context, which also correlates retries of the same prompt
+        prompt_key = self._prompt_key(prompt)
+
+        # Context attached to every log record of this analysis
+        log = _RequestLogger(
+            logger, {"url": url, "provider": self.provider, "prompt_key": prompt_key}
         )
 
+        # Serve repeated analyses from the caches when enabled
+        cached_task = self._get_cached_task(task_description, url, prompt_key, log)
+        if cached_task is not None:
+            return cached_task
+
+        if self._single_flight is None:
+            return await self._run_analysis(task_description, url, prompt, prompt_key, log)
+
+        # Identical analyses already in flight are awaited instead of repeated
+        task, shared = await self._single_flight.do(
+            prompt_key,
+            functools.partial(self._run_analysis, task_description, url, prompt, prompt_key, log),
+        )
+        if shared:
+            log.info("Task analysis shared with an in-flight request")
+            return task.model_copy(deep=True)
+        return task
+
+    async def _run_analysis(
+        self,
+        task_description: str,
+        url: str,
+        prompt: str,
+        prompt_key: str,
+        log: _RequestLogger,
+    ) -> Task:
+        """
+        Send the analysis prompt to the LLM, with retries, and cache the result.
+
+        Args:
+            task_description: Natural language description of the task to perform
+            url: The URL where the task should be performed
+            prompt: The formatted analysis prompt
+            prompt_key: Cache key of the prompt
+            log: Logger bound to this analysis' context
+
+        Returns:
+            Task: A structured Task object containing objectives, success criteria, etc.
+
+        Raises:
+            InvalidResponseFormatError: If the response format is invalid
+            ValidationError: If the task data validation fails
+            LLMCommunicationError: If communication with LLM fails after retries
+            RateLimitError: If rate limit is exceeded
+            ContextLengthExceededError: If prompt is too long
+        """
+        prompt_length = len(prompt)
+
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "Starting task analysis",
+                extra={
+                    "task_description_length": len(task_description),
+                    "prompt_length": prompt_length,
+                },
+            )
+
+        # A valid stored response skips the LLM call entirely
+        task = await self._load_stored_task(prompt_key, prompt_length, log)
+        if task is not None:
+            self._cache_task(task_description, url, prompt_key, task)
+            return task
+
         # Create the retry decorator dynamically
-        retry_decorator = self._create_retry_decorator()
+        retry_decorator = self._create_retry_decorator(log)
 
         @retry_decorator
-        async def _analyze_with_retry() -> Task:
+        async def _analyze_with_retry() -> tuple[Task, str]:
             """Inner function that performs the actual analysis with retry logic."""
             try:
                 # Call the LLM with timeout
                 response = await self._perform_llm_call(prompt)
 
                 # Process the response
-                return await self._handle_llm_response(response, prompt_length)
+                return await self._handle_llm_response(response, prompt_length), response
 
             except ValueError as e:
                 # Check if it's a rate limit error
-                error_msg = str(e).lower()
-                if "rate limit" in error_msg or "too many requests" in error_msg:
-                    logger.warning("Rate limit detected")
+                if _is_rate_limit_error(e):
+                    log.warning("Rate limit detected")
                     msg = "Rate limit exceeded for LLM API"
-                    raise RateLimitError(msg) from e
+                    raise RateLimitError(msg, retry_after=_retry_after_seconds(e)) from e
                 # Re-raise other ValueErrors
                 raise
 
             except TimeoutError as e:
-                logger.warning(
+                log.warning(
                     "LLM request timed out",
                     extra={"timeout": self.timeout},
                 )
                 msg = f"LLM request timed out after {self.timeout} seconds"
                 raise LLMCommunicationError(msg, original_error=e) from e
 
-            except (InvalidResponseFormatError, ValidationError, ContextLengthExceededError):
+            except _ANALYSIS_ERRORS:
                 # These are our custom exceptions - don't wrap them
                 raise
 
             except Exception as e:
-                logger.warning(
+                # Provider SDKs report rate limits as HTTP 429 errors
+                if getattr(e, "status_code", None) == HTTP_TOO_MANY_REQUESTS:
+                    log.warning("Rate limit detected")
+                    msg = "Rate limit exceeded for LLM API"
+                    raise RateLimitError(msg, retry_after=_retry_after_seconds(e)) from e
+
+                log.warning(
                     "Unexpected error during task analysis",
                     extra={"error": str(e), "error_type": type(e).__name__},
                 )
@@ -345,7 +757,7 @@ class WebTaskAnalyzer:
                 raise LLMCommunicationError(msg, original_error=e) from e
 
         try:
-            return await _analyze_with_retry()
+            task, response = await _analyze_with_retry()
         except tenacity.RetryError as e:
             # Extract the last exception from tenacity
             last_exception = e.last_attempt.exception() if e.last_attempt else None
@@ -364,6 +776,201 @@ class WebTaskAnalyzer:
                 retry_count=attempts,
             ) from last_exception
 
+        # Only responses that parsed and validated reach the store
+        await self._store_response(prompt_key, response, log)
+        self._cache_task(task_description, url, prompt_key, task)
+        return task
+
+    async def analyze_tasks(
+        self,
+        tasks: list[tuple[str, str]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Task | BaseException]:
+        """
+        Analyze several task descriptions concurrently.
+
+        Each analysis is an independent, I/O-bound LLM round-trip, so running them
+        concurrently overlaps the network latency. A semaphore caps the number of
+        in-flight requests to stay within provider rate limits.
+
+        Args:
+            tasks: List of (task_description, url) pairs to analyze
+            max_concurrency: Maximum number of analyses running at once (default: 8)
+
+        Returns:
+            list[Task | BaseException]: One entry per input pair, in input order. Failed
+            analyses are returned as their exception instead of being raised.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _analyze_one(task_description: str, url: str) -> Task:
+            """Analyze a single pair while holding a concurrency slot."""
+            async with semaphore:
+                return await self.analyze_task(task_description, url)
+
+        return await asyncio.gather(
+            *(_analyze_one(task_description, url) for task_description, url in tasks),
+            return_exceptions=True,
+        )
+
+    async def _load_stored_task(
+        self, prompt_key: str, prompt_length: int, log: _RequestLogger
+    ) -> Task | None:
+        """
+        Look up and parse a previous response in the response store.
+
+        The store is best effort: backend failures and stored responses that no
+        longer parse or validate are logged and treated as misses.
+
+        Args:
+            prompt_key: Cache key of the formatted analysis prompt
+            prompt_length: Length of the formatted analysis prompt
+            log: Logger bound to this analysis' context
+
+        Returns:
+            Task | None: The Task parsed from the stored response, None otherwise
+        """
+        if self._response_store is None:
+            return None
+
+        try:
+            stored_response = await self._response_store.get(prompt_key)
+        except Exception as e:  # noqa: BLE001 - a failing store must not fail the analysis
+            log.warning(
+                "Response store lookup failed",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
+            return None
+        if stored_response is None:
+            return None
+
+        try:
+            task = await self._handle_llm_response(stored_response, prompt_length)
+        except (InvalidResponseFormatError, ValidationError) as e:
+            log.warning(
+                "Ignoring invalid response from response store",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
+            return None
+
+        log.info("Task analysis served from response store")
+        return task
+
+    async def _store_response(self, prompt_key: str, response: str, log: _RequestLogger) -> None:
+        """
+        Save a validated response in the response store, if one is configured.
+
+        Args:
+            prompt_key: Cache key of the formatted analysis prompt
+            response: The raw LLM response
+            log: Logger bound to this analysis' context
+        """
+        if self._response_store is None:
+            return
+
+        try:
+            await self._response_store.set(prompt_key, response)
+        except Exception as e:  # noqa: BLE001 - a failing store must not fail the analysis
+            log.warning(
+                "Response store update failed",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
+
+    def _get_cached_task(
+        self, task_description: str, url: str, prompt_key: str, log: _RequestLogger
+    ) -> Task | None:
+        """
+        Look up a previous analysis in the response and structural template caches.
+
+        Args:
+            task_description: Natural language description of the task
+            url: The URL where the task should be performed
+            prompt_key: Cache key of the formatted analysis prompt
+            log: Logger bound to this analysis' context
+
+        Returns:
+            Task | None: A fresh Task on a cache hit, None otherwise
+        """
+        if self._response_cache is not None:
+            cached_task = self._response_cache.get(prompt_key)
+            if cached_task is not None:
+                log.info("Task analysis served from cache")
+                return cached_task.model_copy(deep=True)
+
+        if self._structural_cache is not None:
+            template_data = self._structural_cache.get(task_description, url)
+            if template_data is not None:
+                log.info("Task analysis served from structural template")
+                return Task(**template_data)
+
+        return None
+
+    def _cache_task(self, task_description: str, url: str, prompt_key: str, task: Task) -> None:
+        """
+        Store a completed analysis in the enabled caches.
+
+        Args:
+            task_description: Natural language description of the task
+            url: The URL where the task should be performed
+            prompt_key: Cache key of the formatted analysis prompt
+            task: The analyzed task
+        """
+        if self._response_cache is not None:
+            self._response_cache.set(prompt_key, task.model_copy(deep=True))
+        if self._structural_cache is not None:
+            self._structural_cache.set(task_description, url, task.model_dump())
+
+    def _check_prompt_size(self, prompt: str) -> None:
+        """
+        Fail fast on prompts that cannot fit in the model's context window.
+
+        The token count is estimated from the prompt length, so only prompts that
+        clearly exceed the window (minus the room reserved for the response) are
+        rejected; anything closer to the limit is left for the provider to judge.
+        Prompt configurations without max_context_tokens are not checked.
+
+        Args:
+            prompt: The formatted analysis prompt
+
+        Raises:
+            ContextLengthExceededError: If the estimated prompt size exceeds the budget
+        """
+        max_context_tokens = self.prompt_config.get("max_context_tokens")
+        if max_context_tokens is None:
+            return
+
+        budget_tokens = max_context_tokens - self.prompt_config.get("max_tokens", 0)
+        estimated_tokens = len(prompt) // CHARS_PER_TOKEN_ESTIMATE
+        if estimated_tokens > budget_tokens:
+            msg = (
+                f"Prompt of about {estimated_tokens} tokens exceeds the {budget_tokens} "
+                f"tokens available in the LLM context window"
+            )
+            raise ContextLengthExceededError(
+                msg,
+                prompt_length=len(prompt),
+                max_length=budget_tokens * CHARS_PER_TOKEN_ESTIMATE,
+            )
+
+    def _prompt_key(self, prompt: str) -> str:
+        """
+        Build the cache and in-flight registry key for a prompt.
+
+        Args:
+            prompt: The formatted analysis prompt
+
+        Returns:
+            str: A digest of the provider and prompt
+        """
+        return hashlib.blake2b(f"{self.provider}|{prompt}".encode(), digest_size=16).hexdigest()
+
     def _build_analysis_prompt(self, task_description: str, url: str) -> str:
         """
         Build the prompt for the LLM to analyze the task.
@@ -375,10 +982,9 @@ class WebTaskAnalyzer:
         Returns:
             str: The formatted prompt for the LLM
         """
-        prompt_template = self.prompt_config["prompt"]
-        return prompt_template.format(url=url, task_description=task_description)
+        return _format_prompt(self.prompt_config["prompt"], url, task_description)
 
-    def _parse_llm_response(self, response: str) -> dict[str, Any]:
+    def _parse_llm_response(self, response: str) -> TaskData:
         """
         Parse the LLM response into a dictionary suitable for Task creation.
 
@@ -386,41 +992,36 @@ class WebTaskAnalyzer:
             response: The raw response from the LLM
 
         Returns:
-            Dict[str, Any]: Parsed data ready for Task object creation
+            TaskData: Parsed data ready for Task object creation
 
         Raises:
             InvalidResponseFormatError: If the response format is invalid
             ValidationError: If validation of parsed data fails
         """
+        # A response without an opening brace cannot contain an object: skip extraction
+        if "{" not in response:
+            raise _no_json_object_error(response)
+
         # Extract JSON from the response
-        parse_start = time.time()
+        parse_start = time.perf_counter()
         data = extract_json_from_text(response)
-        parse_time = time.time() - parse_start
+        parse_time = time.perf_counter() - parse_start
 
-        logger.debug(
-            "JSON extraction completed",
-            extra={"parse_time": parse_time, "found_json": data is not None},
-        )
-
-        if not data:
-            error_msg = (
-                f"No valid JSON object found in LLM response. "
-                f"Expected a JSON object with task analysis, but received: "
-                f"{response[:RESPONSE_PREVIEW_LENGTH]}{'...' if len(response) > RESPONSE_PREVIEW_LENGTH else ''}"
-            )
-            raise InvalidResponseFormatError(
-                error_msg,
-                response=response,
-                expected_format="JSON object with fields: description, objectives, success_criteria",
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "JSON extraction completed",
+                extra={"parse_time": parse_time, "found_json": data is not None},
             )
 
-        # Validate required fields
-        required_fields = ["description", "objectives", "success_criteria"]
-        missing_fields = [field for field in required_fields if field not in data]
-        if missing_fields:
+        if data is None:
+            raise _no_json_object_error(response)
+
+        # Validate required fields (set check on the happy path, ordered list on error)
+        if not _REQUIRED_FIELD_SET.issubset(data):
+            missing_fields = [field for field in REQUIRED_FIELDS if field not in data]
             error_msg = (
                 f"Missing required fields: {', '.join(missing_fields)}. "
-                f"Expected all of: {', '.join(required_fields)}. "
+                f"Expected all of: {', '.join(REQUIRED_FIELDS)}. "
                 f"Received fields: {', '.join(data.keys())}"
             )
             raise ValidationError(
@@ -434,105 +1035,112 @@ class WebTaskAnalyzer:
         data.setdefault("constraints", [])
         data.setdefault("context", {})
 
-        # Normalize optional fields (convert "null", [], etc. to None)
-        normalize_optional_fields(data, ["data_to_extract", "actions_to_perform"])
-
-        # Validate field types (after normalization)
+        # Validate field types, normalizing optional fields ("null", [], etc. to None)
         self._validate_field_types(data)
 
         # Ensure lists have required minimum items
-        if not data.get("objectives") or len(data["objectives"]) == 0:
-            msg = "Field 'objectives' must contain at least one item"
-            raise ValidationError(
-                msg,
-                field="objectives",
-                value=data.get("objectives"),
-                expected_type="Non-empty list of strings",
-            )
+        for field in NON_EMPTY_LIST_FIELDS:
+            items = data[field]
+            if not items:
+                msg = f"Field '{field}' must contain at least one item"
+                raise ValidationError(
+                    msg,
+                    field=field,
+                    value=items,
+                    expected_type="Non-empty list of strings",
+                )
 
-        if not data.get("success_criteria") or len(data["success_criteria"]) == 0:
-            msg = "Field 'success_criteria' must contain at least one item"
-            raise ValidationError(
-                msg,
-                field="success_criteria",
-                value=data.get("success_criteria"),
-                expected_type="Non-empty list of strings",
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response parsing completed",
+                extra={
+                    "objectives_count": len(data["objectives"]),
+                    "success_criteria_count": len(data["success_criteria"]),
+                    "has_data_to_extract": data.get("data_to_extract") is not None,
+                    "has_actions": data.get("actions_to_perform") is not None,
+                },
             )
 
-        logger.debug(
-            "Response parsing completed",
-            extra={
-                "objectives_count": len(data.get("objectives", [])),
-                "success_criteria_count": len(data.get("success_criteria", [])),
-                "has_data_to_extract": data.get("data_to_extract") is not None,
-                "has_actions": data.get("actions_to_perform") is not None,
-            },
-        )
-
-        return data
+        return cast("TaskData", data)
 
     def _validate_field_types(self, data: dict[str, Any]) -> None:
         """
         Validate that fields have the correct types.
 
+        Optional list fields spelled as null ("null", "None", []) are normalized to
+        None in place, in the same pass that validates them. Required fields and the
+        constraints and context defaults are expected to be present already.
+
         Args:
             data: The parsed data dictionary
 
         Raises:
             ValidationError: If any field has an incorrect type
         """
+        # Reject fields the Task model does not define
+        unexpected_fields = data.keys() - _TASK_FIELD_SET
+        if unexpected_fields:
+            field = sorted(unexpected_fields)[0]
+            msg = f"Unexpected fields: {', '.join(sorted(unexpected_fields))}"
+            raise ValidationError(
+                msg,
+                field=field,
+                value=data[field],
+                expected_type=f"One of: {', '.join(Task.model_fields)}",
+            )
+
         # Validate string fields
-        if not isinstance(data.get("description"), str):
+        description = data["description"]
+        if not isinstance(description, str):
             msg = "Field 'description' must be a string"
             raise ValidationError(
                 msg,
                 field="description",
-                value=data.get("description"),
+                value=description,
                 expected_type="string",
             )
 
         # Validate list fields
-        list_fields = ["objectives", "success_criteria", "constraints"]
-        for field in list_fields:
-            if field in data and not isinstance(data[field], list):
+        for field in LIST_FIELDS:
+            items = data[field]
+            if not isinstance(items, list):
                 msg = f"Field '{field}' must be a list"
                 raise ValidationError(
                     msg,
                     field=field,
-                    value=data[field],
+                    value=items,
                     expected_type="list of strings",
                 )
 
             # Validate list items are strings
-            if data.get(field):
-                for i, item in enumerate(data[field]):
-                    if not isinstance(item, str):
-                        msg = f"Item {i} in field '{field}' must be a string"
-                        raise ValidationError(
-                            msg,
-                            field=f"{field}[{i}]",
-                            value=item,
-                            expected_type="string",
-                        )
+            if items:
+                _validate_string_items(field, items)
 
         # Validate optional list fields
-        optional_list_fields = ["data_to_extract", "actions_to_perform"]
-        for field in optional_list_fields:
-            if field in data and data[field] is not None and not isinstance(data[field], list):
+        for field in OPTIONAL_LIST_FIELDS:
+            items = data.get(field)
+            if items is None:
+                continue
+            if is_null_value(items):
+                data[field] = None
+                continue
+            if not isinstance(items, list):
                 msg = f"Field '{field}' must be a list or null"
                 raise ValidationError(
                     msg,
                     field=field,
-                    value=data[field],
+                    value=items,
                     expected_type="list of strings or null",
                 )
+            _validate_string_items(field, items)
 
         # Validate context is a dictionary
-        if "context" in data and not isinstance(data["context"], dict):
+        context = data["context"]
+        if not isinstance(context, dict):
             msg = "Field 'context' must be a dictionary"
             raise ValidationError(
                 msg,
                 field="context",
-                value=data["context"],
+                value=context,
                 expected_type="dictionary",
             )
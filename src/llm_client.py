@@ -1,7 +1,7 @@
 """LLM client implementations using langchain."""
 
 import os
-from typing import cast
+from typing import TYPE_CHECKING, Any, cast
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -11,10 +11,17 @@ from pydantic import SecretStr
 from src.constants import DEFAULT_ANTHROPIC_MODEL, DEFAULT_OPENAI_MODEL
 from src.llm_provider import LLMProvider
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import httpx
+
 
 class LangChainLLMClient:
     """LLM client implementation using the langchain library."""
 
+    __slots__ = ("api_key", "max_tokens", "model", "model_name", "provider", "temperature")
+
     def __init__(
         self,
         provider: str = LLMProvider.ANTHROPIC.value,
@@ -22,6 +29,8 @@ class LangChainLLMClient:
         api_key: str | None = None,
         temperature: float = 0.3,
         max_tokens: int = 1000,
+        *,
+        http_async_client: "httpx.AsyncClient | None" = None,
     ) -> None:
         """
         Initialize the LLM client with langchain.
@@ -34,9 +43,15 @@ class LangChainLLMClient:
                     (ANTHROPIC_API_KEY or OPENAI_API_KEY)
             temperature: Temperature setting for response randomness (default: 0.3)
             max_tokens: Maximum tokens in the response (default: 1000)
+            http_async_client: httpx client to send OpenAI requests through, e.g. one
+                    shared across clients with tuned connection pool limits. The caller
+                    owns and closes it. If None, the langchain integration's
+                    process-wide pooled client is used, which keeps connections alive
+                    across calls for both providers.
 
         Raises:
-            ValueError: If an unsupported provider is specified
+            ValueError: If an unsupported provider is specified, or http_async_client
+                    is given for a provider that does not support it
         """
         self.provider = provider
         self.temperature = temperature
@@ -46,6 +61,10 @@ class LangChainLLMClient:
 
         # Initialize the appropriate model
         if provider == LLMProvider.ANTHROPIC.value:
+            if http_async_client is not None:
+                error_msg = "http_async_client is only supported for the openai provider"
+                raise ValueError(error_msg)
+
             # Get API key from parameter or environment
             anthropic_api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
             if not anthropic_api_key:
@@ -70,6 +89,7 @@ class LangChainLLMClient:
                 api_key=SecretStr(openai_api_key),
                 temperature=temperature,
                 max_tokens=max_tokens,  # pyright: ignore[reportCallIssue]
+                http_async_client=http_async_client,
             )
         else:
             error_msg = f"Unsupported provider: {provider}"
@@ -97,6 +117,54 @@ class LangChainLLMClient:
         # LangChain returns AIMessage with content attribute
         return cast("str", response.content)
 
+    async def complete_stream(self, prompt: str) -> "AsyncIterator[str]":
+        """
+        Complete a prompt and yield the response as it is generated.
+
+        This method satisfies the StreamingLLMClient protocol used by WebTaskAnalyzer
+        when streaming is enabled. Closing the iterator early stops the request.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Yields:
+            Text chunks of the LLM's response
+        """
+        messages = [HumanMessage(content=prompt)]
+
+        # Use astream to receive message chunks as they are generated
+        async for chunk in self.model.astream(messages):
+            content = chunk.content
+            if isinstance(content, str):
+                yield content
+            else:
+                # Some providers stream content blocks instead of plain text
+                for block in content:
+                    if isinstance(block, str):
+                        yield block
+                    elif block.get("type") == "text":
+                        yield cast("str", block.get("text", ""))
+
+    async def warmup(self) -> bool:
+        """
+        Open a pooled connection to the provider API ahead of the first completion.
+
+        Sends a lightweight authenticated request (listing models) through the same
+        SDK client that completions use, so the TCP connection and TLS session are
+        already established and kept alive in the pool when real traffic arrives.
+
+        ChatAnthropic does not expose its async SDK client publicly, and the only
+        public async request is a billed completion, so Anthropic is not warmed up.
+
+        Returns:
+            bool: True if a connection was warmed up, False if the provider is skipped
+        """
+        if not isinstance(self.model, ChatOpenAI):
+            return False
+
+        await self.model.root_async_client.models.list()
+        return True
+
     def complete_with_config(
         self,
         prompt_text: str,
@@ -124,37 +192,14 @@ class LangChainLLMClient:
             messages.append(SystemMessage(content=system_message))
         messages.append(HumanMessage(content=prompt_text))
 
-        # Create a new model instance with custom parameters if provided
-        if temperature is not None or max_tokens is not None:
-            # Use provided values or fall back to instance defaults
-            temp = temperature if temperature is not None else self.temperature
-            max_tok = max_tokens if max_tokens is not None else self.max_tokens
-
-            if self.provider == LLMProvider.ANTHROPIC.value:
-                anthropic_api_key = self.api_key or os.getenv("ANTHROPIC_API_KEY")
-                if not anthropic_api_key:
-                    error_msg = "ANTHROPIC_API_KEY not provided"
-                    raise ValueError(error_msg)
-                model = ChatAnthropic(  # pyright: ignore[reportCallIssue]
-                    model=self.model_name or DEFAULT_ANTHROPIC_MODEL,  # pyright: ignore[reportCallIssue]
-                    api_key=SecretStr(anthropic_api_key),
-                    temperature=temp,
-                    max_tokens=max_tok,  # pyright: ignore[reportCallIssue]
-                )
-            else:  # OpenAI
-                openai_api_key = self.api_key or os.getenv("OPENAI_API_KEY")
-                if not openai_api_key:
-                    error_msg = "OPENAI_API_KEY not provided"
-                    raise ValueError(error_msg)
-                model = ChatOpenAI(  # pyright: ignore[reportCallIssue]
-                    model=self.model_name or DEFAULT_OPENAI_MODEL,
-                    api_key=SecretStr(openai_api_key),
-                    temperature=temp,
-                    max_tokens=max_tok,  # pyright: ignore[reportCallIssue]
-                )
-        else:
-            model = self.model
+        # Pass custom parameters as per-call overrides rather than building a new
+        # model, so every request reuses the same client and its connection pool
+        overrides: dict[str, Any] = {}
+        if temperature is not None:
+            overrides["temperature"] = temperature
+        if max_tokens is not None:
+            overrides["max_tokens"] = max_tokens
 
         # Synchronous invoke
-        response = model.invoke(messages)
+        response = self.model.invoke(messages, **overrides)
         return cast("str", response.content)
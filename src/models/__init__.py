@@ -1,5 +1,5 @@
 """Models package for Scrapinator."""
 
-from .task import Task
+from .task import Task, TaskData
 
-__all__ = ["Task"]
+__all__ = ["Task", "TaskData"]
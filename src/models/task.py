@@ -1,10 +1,27 @@
 """Task model for representing web automation tasks."""
 
-from typing import Any
+from typing import Any, NotRequired, TypedDict
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class TaskData(TypedDict):
+    """
+    Shape of the validated task data parsed from an LLM response.
+
+    Mirrors the fields of ``Task`` so the parsed dictionary can be passed straight
+    to ``Task(**data)``. Optional fields may be absent when the LLM omits them.
+    """
+
+    description: str
+    objectives: list[str]
+    success_criteria: list[str]
+    constraints: list[str]
+    context: dict[str, Any]
+    data_to_extract: NotRequired[list[str] | None]
+    actions_to_perform: NotRequired[list[str] | None]
+
+
 class Task(BaseModel):
     """
     Represents a structured web automation task.
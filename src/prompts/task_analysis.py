@@ -174,19 +174,22 @@ Return only the JSON response, no additional text or explanation."""
 
 # Provider-specific prompt configurations
 # Note: temperature and max_tokens are recommended settings for LLM client implementations
-# The actual enforcement of these limits depends on the LLM client being used
+# The actual enforcement of these limits depends on the LLM client being used.
+# max_context_tokens lets the analyzer reject prompts that cannot fit before sending them
 PROVIDER_CONFIGS = {
     LLMProvider.ANTHROPIC.value: {
         "prompt": TASK_ANALYSIS_PROMPT,
         "system_message": "You are a web automation expert that analyzes tasks and returns structured JSON.",
         "temperature": 0.3,  # Recommended for consistent, focused responses
         "max_tokens": 1000,  # Recommended limit for response size
+        "max_context_tokens": 200_000,  # Context window of the default Claude models
     },
     LLMProvider.OPENAI.value: {
         "prompt": TASK_ANALYSIS_PROMPT,
         "system_message": "You are a web automation expert. Always respond with valid JSON only.",
         "temperature": 0.3,  # Recommended for consistent, focused responses
         "max_tokens": 1000,  # Recommended limit for response size
+        "max_context_tokens": 128_000,  # Context window of the default GPT-4o models
     },
 }
 
@@ -0,0 +1,144 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache backed by an OrderedDict.
+
+    Lookups move the entry to the most-recently-used end; inserting beyond
+    ``maxsize`` evicts the least recently used entry. When ``ttl`` is set, entries
+    older than ``ttl`` seconds are treated as misses and dropped on lookup.
+
+    Examples:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.get("missing") is None
+        True
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep (default: 128)
+            ttl: Seconds an entry stays valid after being stored (default: None, no expiry)
+
+        Raises:
+            ValueError: If maxsize is less than 1 or ttl is not positive
+        """
+        if maxsize < 1:
+            msg = f"maxsize must be at least 1, got {maxsize}"
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = f"ttl must be positive, got {ttl}"
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Values are stored alongside the monotonic time they were set
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def _is_expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at the given time has outlived the ttl."""
+        return self.ttl is not None and time.monotonic() - stored_at >= self.ttl
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return the cached value for a key, or None if it is not cached.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if self._is_expired(stored_at):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The cache key
+            value: The value to cache (None values are not distinguishable from misses)
+        """
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether an unexpired key is cached without updating its recency."""
+        entry = self._entries.get(key) if isinstance(key, str) else None
+        return entry is not None and not self._is_expired(entry[0])
+
+
+class CacheBackend(Protocol):
+    """Protocol for stores of raw LLM response text, such as an external key-value store."""
+
+    async def get(self, key: str) -> str | None:
+        """Return the stored response for a key, or None if it is not stored."""
+        ...
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response under a key."""
+        ...
+
+
+class LRUMemoryCache:
+    """
+    In-process CacheBackend backed by an LRUCache.
+
+    Examples:
+        >>> backend = LRUMemoryCache(maxsize=256)
+        >>> await backend.set("key", '{"description": "..."}')
+        >>> await backend.get("key")
+        '{"description": "..."}'
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            maxsize: Maximum number of responses to keep (default: 128)
+            ttl: Seconds a response stays valid after being stored (default: None, no expiry)
+        """
+        self._entries = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> str | None:
+        """Return the stored response for a key, or None if it is not stored."""
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used one if the cache is full."""
+        self._entries.set(key, value)
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        return len(self._entries)
@@ -2,20 +2,30 @@
 
 import json
 import logging
-import re
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Stateless decoder shared by all extraction calls
+_JSON_DECODER = json.JSONDecoder()
+
+# String spellings of null that LLMs use for absent optional fields
+_NULL_STRINGS = frozenset(("null", "None"))
+
 
 def extract_json_from_text(text: str) -> dict[str, Any] | None:
     """
     Extract JSON object from text that may contain additional content.
 
-    Tries multiple strategies to find and parse JSON:
-    1. Direct parsing if the entire text is valid JSON
-    2. Regex pattern matching to find JSON objects
-    3. Simple bracket matching for JSON objects
+    When the text holds a single JSON object, bare or surrounded by prose (the
+    common cases for LLM replies), the span from its first opening brace to its
+    last closing brace is parsed directly with orjson. Otherwise the text is
+    scanned once, attempting to decode a JSON value at each opening brace with the
+    C-accelerated ``JSONDecoder.raw_decode``. The first position that decodes to a
+    JSON object wins, so surrounding text and later objects are ignored and nested
+    objects are handled without regex backtracking.
 
     Args:
         text: Text that may contain a JSON object
@@ -36,50 +46,98 @@ def extract_json_from_text(text: str) -> dict[str, Any] | None:
     if not text:
         return None
 
-    text = text.strip()
-
-    # Strategy 1: Try to parse the entire text as JSON
-    try:
-        json_data = json.loads(text)
-        if isinstance(json_data, dict):
-            logger.debug("Successfully parsed entire text as JSON")
-            return json_data
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 2: Find JSON using regex pattern
-    # This pattern matches balanced braces
-    json_pattern = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)
-    matches = json_pattern.findall(text)
+    start_idx = text.find("{")
+    if start_idx == -1:
+        logger.debug("No valid JSON object found in text")
+        return None
 
-    for match in matches:
+    # Fast path: the span from the first opening to the last closing brace is the
+    # whole object for bare replies and for replies wrapped in prose or code fences.
+    # For a bare object the slice is the text itself, so nothing is copied.
+    end_idx = text.rfind("}")
+    if end_idx > start_idx:
         try:
-            json_data = json.loads(match)
+            json_data = orjson.loads(text[start_idx : end_idx + 1])
+        except orjson.JSONDecodeError:
+            pass
+        else:
             if isinstance(json_data, dict):
-                logger.debug("Successfully extracted JSON using regex")
+                logger.debug("Successfully parsed JSON object spanning the text")
                 return json_data
-        except json.JSONDecodeError:
-            continue
-
-    # Strategy 3: Find JSON object boundaries
-    start_idx = text.find("{")
-    end_idx = text.rfind("}") + 1
 
-    if start_idx != -1 and end_idx > 0 and start_idx < end_idx:
+    while start_idx != -1:
         try:
-            json_str = text[start_idx:end_idx]
-            json_data = json.loads(json_str)
-            if isinstance(json_data, dict):
-                logger.debug("Successfully extracted JSON using bracket search")
-                return json_data
+            json_data, _ = _JSON_DECODER.raw_decode(text, start_idx)
         except json.JSONDecodeError:
             pass
+        else:
+            if isinstance(json_data, dict):
+                logger.debug("Successfully extracted JSON object at offset %d", start_idx)
+                return json_data
+        start_idx = text.find("{", start_idx + 1)
 
     logger.debug("No valid JSON object found in text")
     return None
 
 
-def normalize_optional_fields(data: dict[str, Any], fields: list[str]) -> dict[str, Any]:
+def decode_leading_json_object(text: str) -> dict[str, Any] | None:
+    """
+    Decode the JSON object that starts at the first opening brace of the text.
+
+    Unlike extract_json_from_text, no later braces are tried, so a complete nested
+    object inside a still-incomplete outer object is never mistaken for the answer.
+    This makes it suitable for checking whether a partially streamed response
+    already contains the full JSON object.
+
+    Args:
+        text: Text that may contain a JSON object
+
+    Returns:
+        Parsed JSON as a dictionary, or None if the object is absent or incomplete
+
+    Examples:
+        >>> decode_leading_json_object('Here: {"key": "value"} trailing')
+        {'key': 'value'}
+
+        >>> decode_leading_json_object('{"key": {"nested": 1}')
+        None
+    """
+    start_idx = text.find("{")
+    if start_idx == -1:
+        return None
+
+    try:
+        json_data, _ = _JSON_DECODER.raw_decode(text, start_idx)
+    except json.JSONDecodeError:
+        return None
+
+    return json_data if isinstance(json_data, dict) else None
+
+
+def is_null_value(value: Any) -> bool:
+    """
+    Check whether a value is one of the ways LLMs spell an absent optional field.
+
+    Args:
+        value: A decoded JSON value
+
+    Returns:
+        True for None, "null", "None" and [], False otherwise
+
+    Examples:
+        >>> is_null_value("null")
+        True
+
+        >>> is_null_value(["item"])
+        False
+    """
+    # Membership test only for strings: lists and dicts are unhashable
+    return value is None or value == [] or (isinstance(value, str) and value in _NULL_STRINGS)
+
+
+def normalize_optional_fields(
+    data: dict[str, Any], fields: list[str] | tuple[str, ...]
+) -> dict[str, Any]:
     """
     Normalize optional fields that might be represented as null strings or empty lists.
 
@@ -91,7 +149,7 @@ def normalize_optional_fields(data: dict[str, Any], fields: list[str]) -> dict[s
 
     Args:
         data: Dictionary to normalize
-        fields: List of field names to check and normalize
+        fields: Field names to check and normalize
 
     Returns:
         The same dictionary with normalized fields
@@ -102,7 +160,8 @@ def normalize_optional_fields(data: dict[str, Any], fields: list[str]) -> dict[s
         {'field1': None, 'field2': None, 'field3': 'value'}
     """
     for field in fields:
-        if field in data and data[field] in [None, "null", "None", []]:
+        value = data.get(field)
+        if value is not None and is_null_value(value):
             data[field] = None
 
     return data
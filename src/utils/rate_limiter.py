@@ -0,0 +1,82 @@
+"""Async rate limiting utilities for pacing outgoing LLM requests."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    The bucket holds up to ``max_rate`` tokens and refills continuously at
+    ``max_rate / time_period`` tokens per second. Each acquisition consumes one
+    token, waiting for the bucket to refill when it is empty. Pacing requests this
+    way keeps a burst of concurrent calls under the provider's rate limit instead
+    of triggering 429 responses and exponential backoff.
+
+    Examples:
+        >>> limiter = AsyncRateLimiter(50, time_period=60.0)  # 50 requests per minute
+        >>> async with limiter:
+        ...     response = await llm.complete(prompt)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_rate: Maximum number of acquisitions allowed per time period
+            time_period: Length of the time period in seconds (default: 60.0)
+
+        Raises:
+            ValueError: If max_rate or time_period is not positive
+        """
+        if max_rate <= 0:
+            msg = f"max_rate must be positive, got {max_rate}"
+            raise ValueError(msg)
+        if time_period <= 0:
+            msg = f"time_period must be positive, got {time_period}"
+            raise ValueError(msg)
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period  # Tokens per second
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill, up to capacity."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_rate), self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it.
+
+        Waiters are served in arrival order because the lock is held while sleeping.
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> None:
+        """Acquire a token when entering the context."""
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: "TracebackType | None",
+    ) -> None:
+        """Tokens are not returned; nothing to release."""
@@ -0,0 +1,81 @@
+"""Deduplication of concurrent identical async calls."""
+
+import asyncio
+import functools
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class _Call:
+    """An in-flight call and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key starts the call; callers arriving while it is still
+    running wait for the same result (or exception) instead of starting their own.
+    The call is only cancelled once every waiting caller has been cancelled, so one
+    caller giving up does not fail the others.
+
+    Examples:
+        >>> flight = SingleFlight()
+        >>> result, shared = await flight.do("key", lambda: fetch("key"))
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry of in-flight calls."""
+        self._calls: dict[str, _Call] = {}
+
+    def _forget(self, key: str, call: _Call, task: "asyncio.Task[Any]") -> None:
+        """Remove a finished call from the registry."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Retrieve the exception so a call whose callers were all cancelled does not
+        # log "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, func: "Callable[[], Awaitable[Any]]") -> tuple[Any, bool]:
+        """
+        Run func for a key, or wait for the call already in flight for that key.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            func: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            A (result, shared) tuple, where shared is True when the result came from
+            a call started by another caller
+        """
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = _Call(asyncio.ensure_future(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(functools.partial(self._forget, key, call))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Forget the call first so callers arriving while it winds down start
+                # a fresh call instead of joining one that is being cancelled
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.task.cancel()
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
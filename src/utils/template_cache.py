@@ -0,0 +1,226 @@
+"""Structural caching of task analyses for near-duplicate task descriptions."""
+
+import copy
+import functools
+import hashlib
+import re
+from typing import TYPE_CHECKING, Any
+
+from src.utils.cache import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# URLs and numbers are the parts of a task description that vary between otherwise
+# identical requests ("top 5 stories" vs "top 10 stories"). URLs are matched first
+# so digits inside them are not treated as separate arguments.
+_URL_PATTERN = re.compile(r"https?://\S+")
+_VARIABLE_TOKEN_PATTERN = re.compile(rf"{_URL_PATTERN.pattern}|\d+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PLACEHOLDER = "#"
+
+
+def _structural_shape(task_description: str) -> tuple[str, list[str]]:
+    """
+    Split a task description into its structural shape and variable tokens.
+
+    Args:
+        task_description: Natural language description of the task
+
+    Returns:
+        A (shape, tokens) tuple, where shape is the lowercased description with URLs
+        and numbers replaced by a placeholder and whitespace collapsed, and tokens are
+        the replaced URLs and numbers in order of appearance
+    """
+    tokens = _VARIABLE_TOKEN_PATTERN.findall(task_description)
+    shape = _VARIABLE_TOKEN_PATTERN.sub(_PLACEHOLDER, task_description.lower())
+    return _WHITESPACE_PATTERN.sub(" ", shape).strip(), tokens
+
+
+def _substitute_strings(
+    value: Any, pattern: re.Pattern[str], replace: "Callable[[re.Match[str]], str]"
+) -> Any:
+    """Recursively apply a single-pass substitution to every string in a JSON-like value."""
+    if isinstance(value, str):
+        return pattern.sub(replace, value)
+    if isinstance(value, list):
+        return [_substitute_strings(item, pattern, replace) for item in value]
+    if isinstance(value, dict):
+        return {key: _substitute_strings(item, pattern, replace) for key, item in value.items()}
+    return value
+
+
+def _replacement_pattern(replacements: dict[str, str]) -> re.Pattern[str]:
+    """
+    Build the single-pass pattern matching the strings to replace in a template.
+
+    Descriptions and other literal strings come first, longest first, so they are
+    replaced whole. Any URL is then matched as a unit, so numbers inside links are
+    never rewritten as standalone numbers. Bare numbers only match on their own,
+    never as part of a longer number, word, or path.
+    """
+    literals = sorted(
+        (old for old in replacements if not old.isdigit() and not _URL_PATTERN.fullmatch(old)),
+        key=len,
+        reverse=True,
+    )
+    numbers = [rf"(?<![\w./=]){re.escape(old)}(?![\w./])" for old in replacements if old.isdigit()]
+    return re.compile("|".join([*map(re.escape, literals), _URL_PATTERN.pattern, *numbers]))
+
+
+def _replace_match(
+    replacements: dict[str, str],
+    url_pattern: re.Pattern[str] | None,
+    matched_tokens: set[str],
+    match: re.Match[str],
+) -> str:
+    """
+    Return the replacement for a match of a template's replacement pattern.
+
+    Matched numbers and URLs are recorded in matched_tokens; strings replaced as a
+    whole, such as the echoed task description, are not.
+    """
+    text = match.group(0)
+    if not _URL_PATTERN.match(text):
+        if text.isdigit():
+            matched_tokens.add(text)
+        return replacements[text]
+
+    # Only URLs from the request are rewritten; links the LLM added are kept as is
+    if url_pattern is None:
+        return text
+
+    def replace_url(url_match: re.Match[str]) -> str:
+        matched_tokens.add(url_match.group(0))
+        return replacements[url_match.group(0)]
+
+    return url_pattern.sub(replace_url, text)
+
+
+def _contains_number(value: Any, numbers: set[int]) -> bool:
+    """Check whether a JSON-like value holds any of the numbers outside of a string."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int | float):
+        return value in numbers
+    if isinstance(value, list):
+        return any(_contains_number(item, numbers) for item in value)
+    if isinstance(value, dict):
+        return any(_contains_number(item, numbers) for item in value.values())
+    return False
+
+
+class StructuralTemplateCache:
+    """
+    Cache of analyzed task data keyed by the structure of the task description.
+
+    Task descriptions that differ only in their URLs and numbers share a cache entry.
+    On a hit, the cached task data is adapted to the new request by replacing the
+    original URL, task description, and variable tokens with the new ones, so a task
+    analyzed for "top 5 stories" can answer "top 10 stories" without an LLM call.
+
+    Substitution is purely textual: it is only as accurate as the LLM's tendency to
+    echo the request's URLs and numbers verbatim. Hits are treated as misses when the
+    variable tokens cannot be mapped unambiguously, when a changed token does not
+    appear verbatim in the cached strings outside the echoed task description (e.g.
+    "5" spelled "five", or only found inside a link), or when a changed number appears
+    as a non-string value (e.g. ``{"price_limit": 50}``). Numbers inside URLs are
+    never rewritten.
+
+    Examples:
+        >>> cache = StructuralTemplateCache(maxsize=64, namespace="anthropic")
+        >>> cache.set("Extract the top 5 stories", "https://a.com", {"objectives": ["Get 5"]})
+        >>> cache.get("Extract the top 10 stories", "https://b.com")
+        {'objectives': ['Get 10']}
+    """
+
+    def __init__(self, maxsize: int = 128, namespace: str = "") -> None:
+        """
+        Initialize the template cache.
+
+        Args:
+            maxsize: Maximum number of templates to keep (default: 128)
+            namespace: Prefix mixed into every key, e.g. the provider name (default: "")
+        """
+        self.namespace = namespace
+        self._templates = LRUCache(maxsize=maxsize)
+
+    def _key(self, shape: str) -> str:
+        """Hash a structural shape into a cache key."""
+        return hashlib.blake2b(f"{self.namespace}|{shape}".encode()).hexdigest()
+
+    def get(self, task_description: str, url: str) -> dict[str, Any] | None:
+        """
+        Return cached task data adapted to a new task description and URL.
+
+        Args:
+            task_description: Natural language description of the new task
+            url: The URL of the new task
+
+        Returns:
+            A fresh copy of the adapted task data, or None on a miss
+        """
+        shape, tokens = _structural_shape(task_description)
+        template = self._templates.get(self._key(shape))
+        # A literal placeholder character in a description can make shapes collide
+        if template is None or len(template["tokens"]) != len(tokens):
+            return None
+
+        replacements = {template["task_description"]: task_description, template["url"]: url}
+        changed_tokens: set[str] = set()
+        for old_token, new_token in zip(template["tokens"], tokens, strict=True):
+            if replacements.setdefault(old_token, new_token) != new_token:
+                return None  # The same token maps to two different values
+            if old_token != new_token:
+                changed_tokens.add(old_token)
+        replacements = {old: new for old, new in replacements.items() if old != new}
+        if not replacements:
+            return copy.deepcopy(template["data"])
+
+        # Numbers stored as JSON numbers cannot be rewritten textually
+        changed_numbers = {int(token) for token in changed_tokens if token.isdigit()}
+        if changed_numbers and _contains_number(template["data"], changed_numbers):
+            return None
+
+        urls = sorted((old for old in replacements if _URL_PATTERN.fullmatch(old)), key=len)
+        url_pattern = re.compile("|".join(map(re.escape, reversed(urls)))) if urls else None
+        matched_tokens: set[str] = set()
+        data = _substitute_strings(
+            template["data"],
+            _replacement_pattern(replacements),
+            functools.partial(_replace_match, replacements, url_pattern, matched_tokens),
+        )
+
+        # A changed token only replaced as part of the echoed description, or not at
+        # all, is spelled differently elsewhere in the cached analysis ("five")
+        if changed_tokens - matched_tokens:
+            return None
+        return data
+
+    def set(self, task_description: str, url: str, data: dict[str, Any]) -> None:
+        """
+        Store analyzed task data as the template for a task description's structure.
+
+        Args:
+            task_description: Natural language description of the analyzed task
+            url: The URL of the analyzed task
+            data: The analyzed task data
+        """
+        shape, tokens = _structural_shape(task_description)
+        self._templates.set(
+            self._key(shape),
+            {
+                "task_description": task_description,
+                "url": url,
+                "tokens": tokens,
+                "data": copy.deepcopy(data),
+            },
+        )
+
+    def clear(self) -> None:
+        """Remove all templates."""
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._templates)
@@ -2,10 +2,11 @@
 
 import asyncio
 import json
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from src import analyzer as analyzer_module
 from src.analyzer import WebTaskAnalyzer
 from src.exceptions import (
     ContextLengthExceededError,
@@ -16,6 +17,7 @@ from src.exceptions import (
 )
 from src.models.task import Task
 from src.prompts.task_analysis import get_prompt_config
+from src.utils.cache import LRUMemoryCache
 
 
 class TestWebTaskAnalyzer:
@@ -198,6 +200,32 @@ class TestWebTaskAnalyzer:
         assert "success_criteria" in prompt
         assert "JSON" in prompt
 
+    def test_build_analysis_prompt_is_cached(self, analyzer):
+        """Test that identical prompt inputs reuse the formatted prompt."""
+        first = analyzer._build_analysis_prompt("Cache me", "https://cache.example.com")
+        second = analyzer._build_analysis_prompt("Cache me", "https://cache.example.com")
+
+        assert first is second
+
+    @pytest.mark.parametrize("provider", ["anthropic", "openai"])
+    def test_build_analysis_prompt_matches_str_format(self, mock_llm_client, provider):
+        """Test that the pre-parsed template renders exactly like str.format."""
+        analyzer = WebTaskAnalyzer(mock_llm_client, provider=provider)
+        description = "Find {braces} and 100% of items"
+
+        prompt = analyzer._build_analysis_prompt(description, "https://example.com/?q={x}")
+
+        assert prompt == analyzer.prompt_config["prompt"].format(
+            url="https://example.com/?q={x}", task_description=description
+        )
+
+    def test_format_prompt_falls_back_for_format_specs(self):
+        """Test that templates with format specs are still rendered by str.format."""
+        template = "{url!r} -> {task_description:>8}"
+
+        assert analyzer_module._parse_prompt_template(template) is None
+        assert analyzer_module._format_prompt(template, "u", "task") == "'u' ->     task"
+
     def test_parse_llm_response_valid(self, analyzer):
         """Test parsing valid LLM response."""
         response = json.dumps(
@@ -246,6 +274,28 @@ class TestWebTaskAnalyzer:
         assert result["data_to_extract"] is None
         assert result["actions_to_perform"] is None
 
+    def test_parse_llm_response_empty_object_reports_missing_fields(self, analyzer):
+        """Test that an empty JSON object is reported as missing fields, not as non-JSON."""
+        with pytest.raises(ValidationError, match="Missing required fields") as exc_info:
+            analyzer._parse_llm_response("{}")
+
+        assert exc_info.value.field == "description"
+
+    def test_parse_llm_response_top_level_array(self, analyzer):
+        """Test that a bare JSON array is rejected as an invalid response format."""
+        with pytest.raises(InvalidResponseFormatError):
+            analyzer._parse_llm_response('["Obj1", "Obj2"]')
+
+    def test_parse_llm_response_without_brace_skips_extraction(self, analyzer):
+        """Test that a response with no opening brace fails before JSON extraction."""
+        with (
+            patch.object(analyzer_module, "extract_json_from_text") as extract,
+            pytest.raises(InvalidResponseFormatError, match="No valid JSON object found"),
+        ):
+            analyzer._parse_llm_response("I cannot help with that request.")
+
+        extract.assert_not_called()
+
     def test_analyzer_with_different_providers(self, mock_llm_client):
         """Test analyzer initialization with different providers."""
         # Test default provider (anthropic)
@@ -313,6 +363,93 @@ class TestWebTaskAnalyzer:
         assert "Rate limit exceeded" in str(exc_info.value)
         assert exc_info.value.retry_count == 2
 
+    @pytest.mark.asyncio
+    async def test_http_429_error_is_rate_limit_with_retry_after(self, mock_llm_client):
+        """Test that provider HTTP 429 errors become RateLimitError with Retry-After."""
+
+        class TooManyRequestsError(Exception):
+            status_code = 429
+            response = Mock(headers={"retry-after": "0.01"})
+
+        mock_llm_client.complete.side_effect = TooManyRequestsError("429 Too Many Requests")
+        analyzer = WebTaskAnalyzer(mock_llm_client, max_retries=2, retry_delay=0.001)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert exc_info.value.retry_after == 0.01
+        assert mock_llm_client.complete.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_above_max_delay_is_not_retried(self, mock_llm_client):
+        """Test that a Retry-After longer than the maximum delay is raised immediately."""
+
+        class TooManyRequestsError(Exception):
+            status_code = 429
+            response = Mock(headers={"retry-after": "3600"})
+
+        mock_llm_client.complete.side_effect = TooManyRequestsError("429 Too Many Requests")
+        analyzer = WebTaskAnalyzer(mock_llm_client, max_retries=3, retry_delay=0.001)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert exc_info.value.retry_after == 3600
+        assert mock_llm_client.complete.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_uses_full_jitter(self, mock_llm_client):
+        """Test that retry waits are drawn between zero and the backoff ceiling."""
+        mock_llm_client.complete.side_effect = [
+            Exception("Network error"),
+            ValueError("Rate limit exceeded"),
+            json.dumps(
+                {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+            ),
+        ]
+        analyzer = WebTaskAnalyzer(mock_llm_client, max_retries=3, retry_delay=0.5)
+
+        with patch.object(analyzer_module.random, "uniform", return_value=0.0) as uniform:
+            await analyzer.analyze_task("Test task", "https://example.com")
+
+        # Plain backoff for the network error, extended backoff for the rate limit
+        assert [c.args for c in uniform.call_args_list] == [(0, 0.5), (0, 5.0)]
+
+    @pytest.mark.asyncio
+    async def test_validation_error_unexpected_field(self, mock_llm_client):
+        """Test that fields the Task model does not define are rejected without retrying."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {
+                "description": "Test",
+                "objectives": ["Test"],
+                "success_criteria": ["Done"],
+                "priority": "high",
+            }
+        )
+        analyzer = WebTaskAnalyzer(mock_llm_client)
+
+        with pytest.raises(ValidationError, match="Unexpected fields: priority") as exc_info:
+            await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert exc_info.value.field == "priority"
+        mock_llm_client.complete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_validation_error_optional_list_item_type(self, mock_llm_client):
+        """Test that items of optional list fields must be strings."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {
+                "description": "Test",
+                "objectives": ["Test"],
+                "success_criteria": ["Done"],
+                "data_to_extract": ["Titles", {"field": "price"}],
+            }
+        )
+        analyzer = WebTaskAnalyzer(mock_llm_client)
+
+        with pytest.raises(ValidationError, match="Item 1 in field 'data_to_extract'"):
+            await analyzer.analyze_task("Test task", "https://example.com")
+
     @pytest.mark.asyncio
     async def test_validation_error_type_checking(self, mock_llm_client):
         """Test type validation for response fields."""
@@ -481,3 +618,409 @@ class TestWebTaskAnalyzer:
         assert analyzer._is_retryable_error(Exception("generic error"))
         assert analyzer._is_retryable_error(ValueError("some other error"))
         assert analyzer._is_retryable_error(TimeoutError("timeout"))
+
+    @pytest.mark.asyncio
+    async def test_analyze_tasks_preserves_order(self, analyzer, mock_llm_client):
+        """Test that batch analysis returns results in input order."""
+
+        async def complete(prompt):
+            description = "first" if "First task" in prompt else "second"
+            return json.dumps(
+                {
+                    "description": description,
+                    "objectives": ["Do something"],
+                    "success_criteria": ["Done"],
+                }
+            )
+
+        mock_llm_client.complete = complete
+
+        results = await analyzer.analyze_tasks(
+            [("First task", "https://example.com"), ("Second task", "https://example.org")]
+        )
+
+        assert [result.description for result in results] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_tasks_returns_exceptions(self, mock_llm_client):
+        """Test that a failed analysis does not abort the rest of the batch."""
+        mock_llm_client.complete.side_effect = [
+            "This is not JSON",
+            json.dumps(
+                {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+            ),
+        ]
+        analyzer = WebTaskAnalyzer(mock_llm_client, max_retries=1)
+
+        results = await analyzer.analyze_tasks(
+            [("Bad task", "https://example.com"), ("Good task", "https://example.com")],
+            max_concurrency=1,
+        )
+
+        assert isinstance(results[0], InvalidResponseFormatError)
+        assert isinstance(results[1], Task)
+
+    @pytest.mark.asyncio
+    async def test_analyze_tasks_limits_concurrency(self, analyzer, mock_llm_client):
+        """Test that no more than max_concurrency analyses run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def complete(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps(
+                {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+            )
+
+        mock_llm_client.complete = complete
+
+        results = await analyzer.analyze_tasks(
+            [(f"Task {i}", "https://example.com") for i in range(6)], max_concurrency=2
+        )
+
+        assert len(results) == 6
+        assert all(isinstance(result, Task) for result in results)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_tasks_invalid_concurrency(self, analyzer):
+        """Test that a non-positive concurrency limit is rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await analyzer.analyze_tasks([("Test task", "https://example.com")], max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_streaming_stops_after_complete_json(self, mock_llm_client):
+        """Test that streaming stops reading once the JSON object is complete."""
+        consumed = []
+
+        async def complete_stream(prompt):
+            chunks = [
+                'Here is the analysis: {"description": "Test", ',
+                '"objectives": ["Obj"], "context": {"key": 1}, ',
+                '"success_criteria": ["Done"]}',
+                " Let me know if you need anything else.",
+            ]
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        mock_llm_client.complete_stream = complete_stream
+        analyzer = WebTaskAnalyzer(mock_llm_client, stream=True)
+
+        task = await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert task.description == "Test"
+        assert task.context == {"key": 1}
+        assert len(consumed) == 3
+        mock_llm_client.complete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_streaming_decodes_only_when_braces_balance(self, mock_llm_client):
+        """Test that the buffer is only decoded once the outer object may be closed."""
+
+        async def complete_stream(prompt):
+            for chunk in [
+                '{"description": "Test", ',
+                '"objectives": ["Obj"], ',
+                '"context": {"key": 1}, ',
+                '"success_criteria": ["Done"]',
+                "}",
+            ]:
+                yield chunk
+
+        mock_llm_client.complete_stream = complete_stream
+        analyzer = WebTaskAnalyzer(mock_llm_client, stream=True)
+
+        with patch.object(
+            analyzer_module,
+            "decode_leading_json_object",
+            wraps=analyzer_module.decode_leading_json_object,
+        ) as decode:
+            task = await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert task.context == {"key": 1}
+        decode.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_streaming_falls_back_without_stream_support(self):
+        """Test that streaming is disabled for clients without complete_stream."""
+        client = Mock(spec=["complete"])
+        client.complete = AsyncMock(
+            return_value=json.dumps(
+                {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+            )
+        )
+        analyzer = WebTaskAnalyzer(client, stream=True)
+
+        assert analyzer.stream is False
+        task = await analyzer.analyze_task("Test task", "https://example.com")
+        assert isinstance(task, Task)
+        client.complete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_acquired_per_llm_call(self, mock_llm_client):
+        """Test that each LLM request waits on the configured rate limiter."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+        analyzer = WebTaskAnalyzer(mock_llm_client, rate_limit_per_minute=60)
+        analyzer.rate_limiter.acquire = AsyncMock()
+
+        await analyzer.analyze_task("Test task", "https://example.com")
+
+        analyzer.rate_limiter.acquire.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_shared_semaphore_limits_requests_across_analyzers(self, mock_llm_client):
+        """Test that analyzers sharing a semaphore share one concurrency budget."""
+        in_flight = 0
+        peak = 0
+
+        async def complete(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps(
+                {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+            )
+
+        mock_llm_client.complete = complete
+        semaphore = asyncio.Semaphore(2)
+        analyzers = [WebTaskAnalyzer(mock_llm_client, concurrency=semaphore) for _ in range(2)]
+
+        results = await asyncio.gather(
+            *(
+                analyzer.analyze_task(f"Task {i}", "https://example.com")
+                for i in range(3)
+                for analyzer in analyzers
+            )
+        )
+
+        assert all(isinstance(result, Task) for result in results)
+        assert peak == 2
+
+    def test_no_rate_limiter_by_default(self, analyzer):
+        """Test that requests are not rate limited unless configured."""
+        assert analyzer.rate_limiter is None
+
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_repeated_llm_calls(self, mock_llm_client):
+        """Test that a cached analysis is returned without calling the LLM again."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+        analyzer = WebTaskAnalyzer(mock_llm_client, response_cache_size=8)
+
+        first = await analyzer.analyze_task("Test task", "https://example.com")
+        first.objectives.append("Mutated")
+        second = await analyzer.analyze_task("Test task", "https://example.com")
+        await analyzer.analyze_task("Other task", "https://example.com")
+
+        assert second.objectives == ["Obj"]
+        assert mock_llm_client.complete.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_response_store_skips_llm_call_across_analyzers(self, mock_llm_client):
+        """Test that a stored response is reused by another analyzer sharing the store."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+        store = LRUMemoryCache()
+
+        first = await WebTaskAnalyzer(mock_llm_client, response_store=store).analyze_task(
+            "Test task", "https://example.com"
+        )
+        second = await WebTaskAnalyzer(mock_llm_client, response_store=store).analyze_task(
+            "Test task", "https://example.com"
+        )
+
+        assert second.objectives == first.objectives == ["Obj"]
+        assert mock_llm_client.complete.call_count == 1
+        assert len(store) == 1
+
+    @pytest.mark.asyncio
+    async def test_response_store_skips_invalid_responses(self, mock_llm_client):
+        """Test that responses failing validation are not stored."""
+        mock_llm_client.complete.return_value = json.dumps({"description": "Test"})
+        store = LRUMemoryCache()
+        analyzer = WebTaskAnalyzer(mock_llm_client, response_store=store)
+
+        with pytest.raises(ValidationError):
+            await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert len(store) == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_response_store_does_not_fail_analysis(self, mock_llm_client):
+        """Test that response store errors are logged and the LLM is used instead."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+        store = Mock()
+        store.get = AsyncMock(side_effect=ConnectionError("store unreachable"))
+        store.set = AsyncMock(side_effect=ConnectionError("store unreachable"))
+        analyzer = WebTaskAnalyzer(mock_llm_client, response_store=store)
+
+        task = await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert task.objectives == ["Obj"]
+        mock_llm_client.complete.assert_called_once()
+        store.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_stored_response_falls_back_to_llm(self, mock_llm_client):
+        """Test that a stored response that no longer validates is treated as a miss."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+        store = Mock()
+        store.get = AsyncMock(return_value="not json")
+        store.set = AsyncMock()
+        analyzer = WebTaskAnalyzer(mock_llm_client, response_store=store)
+
+        task = await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert task.objectives == ["Obj"]
+        mock_llm_client.complete.assert_called_once()
+        store.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_response_cache_disabled_by_default(self, analyzer, mock_llm_client):
+        """Test that every analysis calls the LLM unless the response cache is enabled."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+
+        await analyzer.analyze_task("Test task", "https://example.com")
+        await analyzer.analyze_task("Test task", "https://example.com")
+
+        assert mock_llm_client.complete.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_structural_cache_reuses_analysis_for_similar_tasks(self, mock_llm_client):
+        """Test that tasks differing only in numbers reuse the previous analysis."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {
+                "description": "Extract the top 5 stories",
+                "objectives": ["Extract 5 stories"],
+                "success_criteria": ["5 stories extracted"],
+            }
+        )
+        analyzer = WebTaskAnalyzer(mock_llm_client, structural_cache_size=8)
+
+        await analyzer.analyze_task("Extract the top 5 stories", "https://example.com")
+        task = await analyzer.analyze_task("Extract the top 10 stories", "https://example.com")
+
+        assert task.description == "Extract the top 10 stories"
+        assert task.objectives == ["Extract 10 stories"]
+        assert task.success_criteria == ["10 stories extracted"]
+        mock_llm_client.complete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_opens_requested_connections(self, mock_llm_client):
+        """Test that warmup calls the client's warmup once per requested connection."""
+        mock_llm_client.warmup = AsyncMock()
+        analyzer = WebTaskAnalyzer(mock_llm_client)
+
+        await analyzer.warmup(connections=3)
+
+        assert mock_llm_client.warmup.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_warmup_waits_for_rate_limiter(self, mock_llm_client):
+        """Test that warmup requests go through the same rate limiter as analyses."""
+        mock_llm_client.warmup = AsyncMock(return_value=True)
+        analyzer = WebTaskAnalyzer(mock_llm_client, rate_limit_per_minute=60)
+        analyzer.rate_limiter.acquire = AsyncMock()
+
+        await analyzer.warmup(connections=2)
+
+        assert analyzer.rate_limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warmup_failure_is_not_raised(self, mock_llm_client):
+        """Test that a failed warmup is logged instead of raised."""
+        mock_llm_client.warmup = AsyncMock(side_effect=ConnectionError("unreachable"))
+        analyzer = WebTaskAnalyzer(mock_llm_client)
+
+        await analyzer.warmup()
+
+        mock_llm_client.warmup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warmup_skipped_without_client_support(self):
+        """Test that warmup is a no-op for clients without a warmup method."""
+        client = Mock(spec=["complete"])
+        analyzer = WebTaskAnalyzer(client)
+
+        await analyzer.warmup()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_analyses_share_one_llm_call(self, mock_llm_client):
+        """Test that concurrent analyses of the same task are coalesced."""
+
+        async def complete(prompt):
+            await asyncio.sleep(0.01)
+            return json.dumps(
+                {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+            )
+
+        mock_llm_client.complete = AsyncMock(side_effect=complete)
+        analyzer = WebTaskAnalyzer(mock_llm_client, coalesce_requests=True)
+
+        first, second = await asyncio.gather(
+            analyzer.analyze_task("Test task", "https://example.com"),
+            analyzer.analyze_task("Test task", "https://example.com"),
+        )
+
+        assert first == second
+        assert first is not second
+        mock_llm_client.complete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_request_coalescing_disabled_by_default(self, analyzer, mock_llm_client):
+        """Test that each concurrent analysis calls the LLM unless coalescing is enabled."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+
+        await asyncio.gather(
+            analyzer.analyze_task("Test task", "https://example.com"),
+            analyzer.analyze_task("Test task", "https://example.com"),
+        )
+
+        assert mock_llm_client.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_log_records_carry_request_context(self, mock_llm_client, caplog):
+        """Test that analysis log records include the bound url and provider."""
+        mock_llm_client.complete.return_value = json.dumps(
+            {"description": "Test", "objectives": ["Obj"], "success_criteria": ["Done"]}
+        )
+        analyzer = WebTaskAnalyzer(mock_llm_client, provider="openai")
+
+        with caplog.at_level("INFO", logger="src.analyzer"):
+            await analyzer.analyze_task("Test task", "https://example.com")
+
+        start_record = next(r for r in caplog.records if r.message == "Starting task analysis")
+        assert start_record.url == "https://example.com"
+        assert start_record.provider == "openai"
+        assert start_record.prompt_length > 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_prompt_rejected_before_llm_call(self, mock_llm_client):
+        """Test that a prompt exceeding the context window fails without calling the LLM."""
+        analyzer = WebTaskAnalyzer(mock_llm_client)
+        max_context_tokens = analyzer.prompt_config["max_context_tokens"]
+
+        with pytest.raises(ContextLengthExceededError, match="exceeds") as exc_info:
+            await analyzer.analyze_task("x" * (max_context_tokens * 4), "https://example.com")
+
+        assert exc_info.value.details["prompt_length"] > exc_info.value.details["max_length"]
+        mock_llm_client.complete.assert_not_called()
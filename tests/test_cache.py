@@ -0,0 +1,80 @@
+"""Tests for in-process caching utilities."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.cache import LRUCache, LRUMemoryCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that stored values are returned."""
+        cache = LRUCache(maxsize=2)
+        cache.set("key", {"value": 1})
+        assert cache.get("key") == {"value": 1}
+
+    def test_missing_key_returns_none(self):
+        """Test that a miss returns None."""
+        cache = LRUCache()
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_clear_removes_all_entries(self):
+        """Test that clear empties the cache."""
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError, match="maxsize"):
+            LRUCache(maxsize=0)
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries older than the ttl are dropped on lookup."""
+        cache = LRUCache(ttl=10.0)
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.utils.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch("src.utils.cache.time.monotonic", return_value=110.0):
+            assert "a" not in cache
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalid_ttl(self):
+        """Test that a non-positive ttl is rejected."""
+        with pytest.raises(ValueError, match="ttl"):
+            LRUCache(ttl=0)
+
+
+class TestLRUMemoryCache:
+    """Test cases for LRUMemoryCache."""
+
+    @pytest.mark.asyncio
+    async def test_get_and_set(self):
+        """Test that stored responses are returned and evicted in LRU order."""
+        backend = LRUMemoryCache(maxsize=1)
+        await backend.set("a", "first")
+        assert await backend.get("a") == "first"
+
+        await backend.set("b", "second")
+        assert await backend.get("a") is None
+        assert await backend.get("b") == "second"
+        assert len(backend) == 1
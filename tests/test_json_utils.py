@@ -1,6 +1,13 @@
 """Tests for JSON utility functions."""
 
-from src.utils.json_utils import extract_json_from_text, normalize_optional_fields
+import math
+
+from src.utils.json_utils import (
+    decode_leading_json_object,
+    extract_json_from_text,
+    is_null_value,
+    normalize_optional_fields,
+)
 
 
 class TestExtractJsonFromText:
@@ -30,6 +37,22 @@ class TestExtractJsonFromText:
         result = extract_json_from_text(text)
         assert result == {"key": "value", "nested": {"inner": True}}
 
+    def test_extract_json_from_code_fence(self):
+        """Test extracting a JSON object wrapped in a markdown code fence."""
+        text = 'Here you go:\n```json\n{"key": {"nested": [1, 2]}}\n```\nLet me know!'
+        result = extract_json_from_text(text)
+        assert result == {"key": {"nested": [1, 2]}}
+
+    def test_extract_json_with_surrounding_whitespace(self):
+        """Test that whitespace around a bare JSON object is tolerated without stripping."""
+        text = '\n\t  {"key": "value"}  \n'
+        result = extract_json_from_text(text)
+        assert result == {"key": "value"}
+
+    def test_whitespace_only_returns_none(self):
+        """Test that whitespace-only text returns None."""
+        assert extract_json_from_text("  \n\t ") is None
+
     def test_extract_nested_json(self):
         """Test extracting JSON with nested objects."""
         text = '{"outer": {"inner": {"deep": "value"}}}'
@@ -89,6 +112,56 @@ class TestExtractJsonFromText:
         # Should return the first valid JSON object found
         assert result == {"first": 1}
 
+    def test_deeply_nested_json_with_trailing_braces(self):
+        """Test extraction of deeply nested JSON followed by unrelated braces."""
+        text = 'Result: {"a": {"b": {"c": 1}}} note: {not json}'
+        result = extract_json_from_text(text)
+        assert result == {"a": {"b": {"c": 1}}}
+
+    def test_skips_invalid_object_before_valid_one(self):
+        """Test that an invalid brace block does not hide a later valid object."""
+        text = '{not json} then {"key": 1}'
+        result = extract_json_from_text(text)
+        assert result == {"key": 1}
+
+    def test_bare_object_rejected_by_fast_path_falls_back(self):
+        """Test that objects orjson rejects are still parsed by the stdlib scanner."""
+        result = extract_json_from_text('{"value": NaN}')
+        assert result is not None
+        assert math.isnan(result["value"])
+
+
+class TestDecodeLeadingJsonObject:
+    """Test cases for decode_leading_json_object function."""
+
+    def test_decode_complete_object_with_surrounding_text(self):
+        """Test decoding an object with text before and after it."""
+        text = 'Here you go: {"key": "value"} anything else?'
+        assert decode_leading_json_object(text) == {"key": "value"}
+
+    def test_incomplete_object_returns_none(self):
+        """Test that a complete nested object is not returned while the outer one is open."""
+        text = '{"outer": {"inner": 1}'
+        assert decode_leading_json_object(text) is None
+
+    def test_no_brace_returns_none(self):
+        """Test that text without an opening brace returns None."""
+        assert decode_leading_json_object("No JSON here") is None
+
+
+class TestIsNullValue:
+    """Test cases for is_null_value function."""
+
+    def test_null_spellings(self):
+        """Test that every null spelling is recognized."""
+        assert all(is_null_value(value) for value in (None, "null", "None", []))
+
+    def test_non_null_values(self):
+        """Test that real values, including unhashable ones, are not null."""
+        assert not any(
+            is_null_value(value) for value in ("value", ["item"], {"key": "value"}, 0, "")
+        )
+
 
 class TestNormalizeOptionalFields:
     """Test cases for normalize_optional_fields function."""
@@ -44,6 +44,9 @@ class TestPromptTemplates:
             assert "system_message" in config, f"{provider} missing 'system_message'"
             assert "temperature" in config, f"{provider} missing 'temperature'"
             assert "max_tokens" in config, f"{provider} missing 'max_tokens'"
+            assert config["max_context_tokens"] > config["max_tokens"], (
+                f"{provider} 'max_context_tokens' must leave room for the response"
+            )
 
     def test_anthropic_config_uses_full_prompt(self) -> None:
         """Test that Anthropic config uses the full prompt."""
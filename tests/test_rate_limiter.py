@@ -0,0 +1,54 @@
+"""Tests for the async rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limiter import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Test cases for AsyncRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity_does_not_wait(self):
+        """Test that acquisitions within capacity complete immediately."""
+        limiter = AsyncRateLimiter(5, time_period=60.0)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_bucket_empty(self):
+        """Test that an acquisition beyond capacity waits for a refill."""
+        limiter = AsyncRateLimiter(2, time_period=0.2)  # One token every 0.1s
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_context_manager_paces_concurrent_callers(self):
+        """Test that concurrent callers are paced by the limiter."""
+        limiter = AsyncRateLimiter(1, time_period=0.05)
+
+        async def use_limiter():
+            async with limiter:
+                return time.monotonic()
+
+        start = time.monotonic()
+        timestamps = await asyncio.gather(*(use_limiter() for _ in range(3)))
+
+        assert max(timestamps) - start >= 0.09
+
+    @pytest.mark.parametrize(("max_rate", "time_period"), [(0, 60.0), (-1, 60.0), (10, 0)])
+    def test_invalid_arguments(self, max_rate, time_period):
+        """Test that non-positive rates and periods are rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            AsyncRateLimiter(max_rate, time_period=time_period)
@@ -0,0 +1,137 @@
+"""Tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent calls with the same key run the function once."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(3)))
+
+        assert calls == 1
+        assert [result for result, _ in results] == ["result"] * 3
+        assert [shared for _, shared in results] == [False, True, True]
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test that calls with different keys are not coalesced."""
+        flight = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b"))
+        )
+
+        assert results == [("a", False), ("b", False)]
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """Test that every waiting caller receives the call's exception."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_does_not_cancel_others(self):
+        """Test that the call keeps running while other callers still wait on it."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == ("result", True)
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_call_cancelled_when_all_callers_cancel(self):
+        """Test that the call is cancelled once no caller is waiting on it."""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+        await asyncio.sleep(0)
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_caller_arriving_during_cancellation_starts_a_new_call(self):
+        """Test that a late caller does not join a call that is being cancelled."""
+        flight = SingleFlight()
+        cleanup_started = asyncio.Event()
+        finish_cleanup = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                return "fresh"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # Slow cleanup on cancel, like closing a stream
+                cleanup_started.set()
+                await finish_cleanup.wait()
+                raise
+            return "stale"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await cleanup_started.wait()
+
+        late = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        finish_cleanup.set()
+
+        assert await late == ("fresh", False)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert calls == 2
@@ -0,0 +1,109 @@
+"""Tests for the structural template cache."""
+
+from src.utils.template_cache import StructuralTemplateCache
+
+
+class TestStructuralTemplateCache:
+    """Test cases for StructuralTemplateCache."""
+
+    def test_adapts_numbers_url_and_description(self):
+        """Test that a structurally identical task reuses the template with new values."""
+        cache = StructuralTemplateCache()
+        cache.set(
+            "Extract the top 5 stories",
+            "https://a.com",
+            {
+                "description": "Extract the top 5 stories",
+                "objectives": ["Open https://a.com", "Collect 5 of the 25 stories"],
+            },
+        )
+
+        result = cache.get("Extract the top 10 stories", "https://b.com")
+
+        assert result == {
+            "description": "Extract the top 10 stories",
+            "objectives": ["Open https://b.com", "Collect 10 of the 25 stories"],
+        }
+
+    def test_ignores_case_and_whitespace(self):
+        """Test that case and whitespace differences share a template."""
+        cache = StructuralTemplateCache()
+        cache.set("Extract the prices", "https://a.com", {"objectives": ["Get prices"]})
+
+        assert cache.get("extract  the PRICES", "https://a.com") == {"objectives": ["Get prices"]}
+
+    def test_different_structure_is_a_miss(self):
+        """Test that descriptions with a different structure do not share a template."""
+        cache = StructuralTemplateCache()
+        cache.set("Extract the prices", "https://a.com", {"objectives": ["Get prices"]})
+
+        assert cache.get("Extract the reviews", "https://a.com") is None
+
+    def test_ambiguous_token_mapping_is_a_miss(self):
+        """Test that a repeated token mapped to two different values is not reused."""
+        cache = StructuralTemplateCache()
+        cache.set("Pages 5 to 5", "https://a.com", {"objectives": ["Visit page 5"]})
+
+        assert cache.get("Pages 3 to 7", "https://a.com") is None
+
+    def test_returned_data_is_a_copy(self):
+        """Test that mutating a returned template does not affect the cache."""
+        cache = StructuralTemplateCache()
+        cache.set("Extract the prices", "https://a.com", {"objectives": ["Get prices"]})
+
+        cache.get("Extract the prices", "https://a.com")["objectives"].append("Mutated")
+
+        assert cache.get("Extract the prices", "https://a.com") == {"objectives": ["Get prices"]}
+
+    def test_changed_number_stored_as_json_number_is_a_miss(self):
+        """Test that a changed number held outside a string is not reused."""
+        cache = StructuralTemplateCache()
+        cache.set(
+            "Find all products under $50",
+            "https://a.com",
+            {"objectives": ["Find products under $50"], "context": {"price_limit": 50}},
+        )
+
+        assert cache.get("Find all products under $30", "https://a.com") is None
+
+    def test_changed_token_not_echoed_verbatim_is_a_miss(self):
+        """Test that a changed token spelled differently in the template is not reused."""
+        cache = StructuralTemplateCache()
+        cache.set(
+            "Extract the top 5 stories",
+            "https://a.com",
+            {"description": "Top five stories", "objectives": ["Collect the stories"]},
+        )
+
+        assert cache.get("Extract the top 10 stories", "https://a.com") is None
+
+    def test_changed_token_only_in_echoed_description_is_a_miss(self):
+        """Test that replacing the echoed description does not count as adapting a token."""
+        cache = StructuralTemplateCache()
+        cache.set(
+            "Extract the top 5 stories",
+            "https://a.com",
+            {"description": "Extract the top 5 stories", "objectives": ["Collect five stories"]},
+        )
+
+        assert cache.get("Extract the top 10 stories", "https://a.com") is None
+
+    def test_numbers_inside_urls_are_not_rewritten(self):
+        """Test that a changed number is not substituted into links in the template."""
+        cache = StructuralTemplateCache()
+        cache.set(
+            "Get 2 items",
+            "https://a.com/p/2",
+            {"objectives": ["Open https://a.com/p/2?page=2", "Collect 2 items"]},
+        )
+
+        assert cache.get("Get 7 items", "https://a.com/p/2") == {
+            "objectives": ["Open https://a.com/p/2?page=2", "Collect 7 items"]
+        }
+
+    def test_changed_number_only_inside_urls_is_a_miss(self):
+        """Test that a changed number appearing only inside a link is not reused."""
+        cache = StructuralTemplateCache()
+        cache.set("Get 2 items", "https://a.com", {"objectives": ["Open https://a.com/page/2"]})
+
+        assert cache.get("Get 7 items", "https://a.com") is None